@@ -6,6 +6,7 @@ import argparse
 import curses
 import logging
 import os
+import stat
 import sys
 from typing import Callable
 
@@ -17,11 +18,7 @@ from juffi.input_controller import (
 from juffi.output_controller import CursesOutputController
 from juffi.views.app import App, AppExit
 
-if is_dev():
-    setup_logging()
-
 logger = logging.getLogger(__name__)
-logger.info("Project root: %s", get_project_root())
 
 
 def _init_app(
@@ -84,12 +81,18 @@ def main() -> None:
         if args.log_file is None:
             parser.error("No log file specified")
 
-        if not os.path.exists(args.log_file):
+        try:
+            file_stat = os.stat(args.log_file)
+        except OSError:
             parser.error(f"File '{args.log_file}' not found")
 
-        if not os.path.isfile(args.log_file):
+        if not stat.S_ISREG(file_stat.st_mode):
             parser.error(f"'{args.log_file}' is not a file")
 
+    if is_dev():
+        setup_logging()
+        logger.info("Project root: %s", get_project_root())
+
     with create_input_controller(args.log_file) as partial_input_controller:
         curses.wrapper(_init_app, partial_input_controller, args)
 
@@ -26,28 +26,10 @@ class Size(NamedTuple):
 class Viewport(NamedTuple):
     """A simple viewport class"""
 
-    pos: Position
-    size: Size
-
-    @property
-    def x(self):
-        """Get the x position"""
-        return self.pos.x
-
-    @property
-    def y(self):
-        """Get the y position"""
-        return self.pos.y
-
-    @property
-    def width(self):
-        """Get the width"""
-        return self.size.width
-
-    @property
-    def height(self):
-        """Get the height"""
-        return self.size.height
+    y: int
+    x: int
+    height: int
+    width: int
 
 
 class Color(enum.IntEnum):
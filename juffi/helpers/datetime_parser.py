@@ -2,18 +2,70 @@
 
 from datetime import datetime
 
+_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
 
 def try_parse_datetime(ts_str: str) -> datetime | None:
     """Try to parse a datetime string using common formats."""
     no_z_ts_str = ts_str.replace("Z", "")
-    for fmt in [
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-    ]:
+
+    parsed = _parse_iso_datetime(no_z_ts_str)
+    if parsed is not None:
+        return parsed
+
+    for fmt in _FORMATS:
         try:
             return datetime.strptime(no_z_ts_str, fmt)
         except ValueError:
             pass
 
     return None
+
+
+def _parse_iso_datetime(ts_str: str) -> datetime | None:
+    """Parse the zero-padded forms of the supported formats by fixed offsets
+
+    Returns None for anything else, leaving it to strptime.
+    """
+    length = len(ts_str)
+    if (
+        length < 19
+        or ts_str[4] != "-"
+        or ts_str[7] != "-"
+        or ts_str[13] != ":"
+        or ts_str[16] != ":"
+    ):
+        return None
+
+    separator = ts_str[10]
+    if length == 19 and separator in ("T", " "):
+        microsecond = 0
+    elif separator == "T" and ts_str[19] == "." and 20 < length <= 26:
+        fraction = ts_str[20:]
+        if not fraction.isdecimal():
+            return None
+        microsecond = int(fraction.ljust(6, "0"))
+    else:
+        return None
+
+    year, month, day = ts_str[0:4], ts_str[5:7], ts_str[8:10]
+    hour, minute, second = ts_str[11:13], ts_str[14:16], ts_str[17:19]
+    if not (year + month + day + hour + minute + second).isdecimal():
+        return None
+
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            microsecond,
+        )
+    except ValueError:
+        return None
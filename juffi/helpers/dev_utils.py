@@ -37,8 +37,16 @@ def setup_logging():
 
 
 @contextlib.contextmanager
-def measure(logger: logging.Logger, name: str) -> Iterator[None]:
-    """Measure execution time of a block of code"""
+def measure(logger: logging.Logger, name: str, *args: object) -> Iterator[None]:
+    """
+    Measure execution time of a block of code.
+    The name is %-formatted with args, only if INFO is enabled
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        yield
+        return
+
     start = time.time()
     yield
-    logger.info("%s took %f seconds", name, time.time() - start)
+    elapsed = time.time() - start
+    logger.info("%s took %f seconds", name % args if args else name, elapsed)
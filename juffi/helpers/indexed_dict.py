@@ -9,21 +9,73 @@ V = TypeVar("V")
 class IndexedDict(OrderedDict[str, V]):
     """Ordered Dictionary that can access values by index"""
 
+    # Built lazily on positional access and dropped on every mutation
+    _values_list: list[V] | None = None
+    _key_index: dict[str, int] | None = None
+
     def __getitem__(self, key: int | str | slice) -> Any:
         """Get the value of the key"""
         if isinstance(key, slice):
             return islice(self.values(), key.start, key.stop, key.step)
         if isinstance(key, int):
-            return list(self.values())[key]
+            if self._values_list is None:
+                self._values_list = list(self.values())
+            return self._values_list[key]
         return super().__getitem__(key)
 
+    def __setitem__(self, key: str, value: V) -> None:
+        self._invalidate()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._invalidate()
+        super().__delitem__(key)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def pop(self, key: str, *args: Any) -> Any:
+        self._invalidate()
+        return super().pop(key, *args)
+
+    def popitem(self, last: bool = True) -> tuple[str, V]:
+        self._invalidate()
+        return super().popitem(last)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._invalidate()
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._invalidate()
+        super().update(*args, **kwargs)
+
+    def move_to_end(self, key: str, last: bool = True) -> None:
+        self._invalidate()
+        super().move_to_end(key, last)
+
+    def move(self, from_index: int, to_index: int) -> None:
+        """Move the item at from_index so that it ends up at to_index"""
+        keys = list(self.keys())
+        keys.insert(to_index, keys.pop(from_index))
+        # Only the keys from the first affected position onwards change places
+        for key in keys[min(from_index, to_index) :]:
+            self.move_to_end(key)
+
     def index(self, key: str) -> int:
         """Get the index of the key"""
-        for i, k in enumerate(self.keys()):
-            if k == key:
-                return i
-        raise KeyError(key)
+        if self._key_index is None:
+            self._key_index = {k: i for i, k in enumerate(self.keys())}
+        try:
+            return self._key_index[key]
+        except KeyError:
+            raise KeyError(key) from None
 
     def copy(self) -> "IndexedDict[V]":
         """Copy the dictionary"""
         return IndexedDict[V](super().copy())
+
+    def _invalidate(self) -> None:
+        self._values_list = None
+        self._key_index = None
@@ -22,10 +22,7 @@ def find_first_index(
     iterable: list[T], predicate: Callable[[T], bool], default: int | None = None
 ) -> int | None:
     """Find the index of the first item in the iterable that matches the predicate"""
-    for i, item in enumerate(iterable):
-        if predicate(item):
-            return i
-    return default
+    return next((i for i, item in enumerate(iterable) if predicate(item)), default)
 
 
 @overload
@@ -40,7 +37,4 @@ def find_first(iterable: Iterable[T], predicate: Callable[[T], bool]) -> T | Non
 
 def find_first(iterable: Iterable[Any], predicate: Callable[[T], bool]) -> Any:
     """Find the first item in the iterable that matches the predicate"""
-    for item in iterable:
-        if predicate(item):
-            return item
-    return None
+    return next((item for item in iterable if predicate(item)), None)
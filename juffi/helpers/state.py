@@ -44,7 +44,14 @@ _MUTATING_METHODS: dict[type, set[str]] = {
     },
 }
 
-_MUTATING_METHODS[IndexedDict] = _MUTATING_METHODS[dict]
+_MUTATING_METHODS[IndexedDict] = _MUTATING_METHODS[dict] | {"move_to_end", "move"}
+
+
+def _is_changed(old_value: Any, value: Any) -> bool:
+    """Check whether a value differs, skipping the comparison for the same object"""
+    if isinstance(old_value, Observable):
+        old_value = old_value._data  # pylint: disable=protected-access
+    return old_value is not value and old_value != value
 
 
 class Observable(Generic[T]):
@@ -104,7 +111,8 @@ class Field(Generic[T]):
     """Descriptor for state fields that automatically tracks changes
 
     Handles both mutable collections (list, dict, set) and immutable values.
-    For mutable collections, wraps them in Observable wrappers and returns copies.
+    For mutable collections, wraps them in Observable wrappers and returns the
+    wrapper itself rather than a copy.
     For immutable values, stores them directly without wrapping or copying.
     """
 
@@ -118,9 +126,11 @@ class Field(Generic[T]):
             self.default_value = default
             self.is_factory = False
         self.name = ""
+        self.private_name = ""
 
     def __set_name__(self, owner: type, name: str) -> None:
         self.name = name
+        self.private_name = f"_{name}"
 
     def __class_getitem__(cls, item: type) -> type:
         """Support Field[T] syntax for type annotations"""
@@ -135,19 +145,17 @@ class Field(Generic[T]):
     def __get__(self, instance: object | None, owner: type) -> "Field[T] | T":
         if instance is None:
             return self
-        private_name = f"_{self.name}"
-        if not hasattr(instance, private_name):
-            value = self.default_factory()
-            wrapped = self._wrap_if_mutable(instance, value)
-            object.__setattr__(instance, private_name, wrapped)
-        return getattr(instance, private_name)
+        value = instance.__dict__.get(self.private_name, _MISSING)
+        if value is _MISSING:
+            value = self._wrap_if_mutable(instance, self.default_factory())
+            object.__setattr__(instance, self.private_name, value)
+        return value
 
     def __set__(self, instance: object, value: T) -> None:
-        private_name = f"_{self.name}"
-        old_value = getattr(instance, private_name, _MISSING)
+        old_value = instance.__dict__.get(self.private_name, _MISSING)
         wrapped = self._wrap_if_mutable(instance, value)
-        object.__setattr__(instance, private_name, wrapped)
-        if isinstance(instance, State) and old_value != value:
+        object.__setattr__(instance, self.private_name, wrapped)
+        if isinstance(instance, State) and _is_changed(old_value, value):
             instance._changed(self.name)
 
     def _wrap_if_mutable(self, instance: object, value: T) -> T:
@@ -195,12 +203,14 @@ class State:
         else:
             old_value = getattr(self, name, _MISSING)
             super().__setattr__(name, value)
-            if old_value != value:
+            if _is_changed(old_value, value):
                 self._changed(name)
 
     def _changed(self, name: str) -> None:
         self._CHANGES.add(name)
-        self._notify_watchers(name)
+        # Most fields have no watchers, so skip the dispatch call for them
+        if name in self._WATCHERS:
+            self._notify_watchers(name)
 
     @property
     def changes(self) -> set[str]:
@@ -217,5 +227,5 @@ class State:
 
     def _notify_watchers(self, name: str) -> None:
         """Notify watchers of a change"""
-        for callback in self._WATCHERS[name]:
+        for callback in self._WATCHERS.get(name, ()):
             callback()
@@ -4,9 +4,12 @@ import contextlib
 import curses
 import fcntl
 import functools
+import mmap
 import os
 from abc import ABC, abstractmethod
-from typing import Callable, Iterator, TextIO
+from typing import BinaryIO, Callable, Iterator
+
+_READ_CHUNK_SIZE = 1 << 20
 
 
 class InputController(ABC):
@@ -60,10 +63,10 @@ class InputController(ABC):
 class FileInputController(InputController):
     """Concrete implementation of input controller for Juffi application"""
 
-    def __init__(self, stdscr: curses.window, file: TextIO) -> None:
+    def __init__(self, stdscr: curses.window, file: BinaryIO) -> None:
         self._stdscr = stdscr
         self._file = file
-        self._incomplete_line: str = ""
+        self._offset: int = 0
         self._stdscr.keypad(True)
 
     @property
@@ -76,22 +79,63 @@ class FileInputController(InputController):
         return self._stdscr.getch()
 
     def get_data(self) -> Iterator[str]:
-        """Fetch data as an iterator of strings from the log file"""
-        while True:
-            line = self._file.readline()
-            if not line:
-                break
+        """Fetch data as an iterator of strings from the log file
 
-            self._incomplete_line += line
-
-            if self._incomplete_line.endswith("\n"):
-                yield self._incomplete_line
-                self._incomplete_line = ""
+        The part of the file after the last complete line that was read is
+        decoded in large chunks, each ending on a newline.
+        A trailing partial line is left in the file until the rest of it is written.
+        """
+        while True:
+            try:
+                data = self._read_mapped_chunk()
+            except (ValueError, OSError):
+                # The file changed size under the mapping, e.g. it was truncated
+                data = self._read_chunk()
+            if not data:
+                return
+            yield from _decode_lines(data)
+
+    def _read_mapped_chunk(self) -> bytes:
+        """Copy the complete lines of the next chunk out of a memory map of the file
+
+        The mapping is closed before the lines are used, as touching it after
+        the file is truncated would crash the process.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        if size <= self._offset:
+            return b""
+
+        with mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            chunk_end = min(self._offset + _READ_CHUNK_SIZE, size)
+            end = mm.rfind(b"\n", self._offset, chunk_end) + 1
+            if not end:
+                end = mm.find(b"\n", chunk_end, size) + 1
+            if not end:
+                return b""
+            data = mm[self._offset : end]
+
+        self._offset = end
+        return data
+
+    def _read_chunk(self) -> bytes:
+        """Read the complete lines of the next chunk from the file"""
+        self._file.seek(self._offset)
+        data = self._file.read(_READ_CHUNK_SIZE)
+        end = data.rfind(b"\n") + 1
+        while not end:
+            # The line is longer than a chunk
+            more = self._file.read(_READ_CHUNK_SIZE)
+            if not more:
+                return b""
+            data += more
+            end = data.rfind(b"\n") + 1
+
+        self._offset += end
+        return data[:end]
 
     def reset(self) -> None:
-        """Reset the file pointer to the beginning"""
-        self._file.seek(0)
-        self._incomplete_line = ""
+        """Reset the read offset to the beginning"""
+        self._offset = 0
 
     def timeout(self, delay: int) -> None:
         """Set blocking or non-blocking read"""
@@ -101,12 +145,12 @@ class FileInputController(InputController):
 class StdinInputController(InputController):
     """Input controller for reading from stdin (piped input)"""
 
-    def __init__(self, stdscr, input_stream: TextIO) -> None:
+    def __init__(self, stdscr, input_stream: BinaryIO) -> None:
         self._stdscr = stdscr
         self._input_stream = input_stream
         self._all_lines: list[str] = []
         self._last_read_index: int = 0
-        self._incomplete_line: str = ""
+        self._incomplete_line: bytes = b""
         self._stdscr.keypad(True)
 
     @property
@@ -119,17 +163,22 @@ class StdinInputController(InputController):
         return self._stdscr.getch()
 
     def get_data(self) -> Iterator[str]:
-        """Fetch data as an iterator of strings from stdin"""
+        """Fetch data as an iterator of strings from stdin
+
+        Whatever input is available is read in large binary chunks and the complete
+        lines of each chunk are decoded at once. A trailing partial line is kept
+        as bytes until the rest of it arrives.
+        """
         while True:
-            line = self._input_stream.readline()
-            if not line:
+            chunk = self._input_stream.read(_READ_CHUNK_SIZE)
+            if not chunk:
                 break
 
-            self._incomplete_line += line
-
-            if self._incomplete_line.endswith("\n"):
-                self._all_lines.append(self._incomplete_line)
-                self._incomplete_line = ""
+            data = self._incomplete_line + chunk
+            end = data.rfind(b"\n") + 1
+            self._incomplete_line = data[end:]
+            if end:
+                self._all_lines.extend(_decode_lines(data[:end]))
 
         new_lines = self._all_lines[self._last_read_index :]
         self._last_read_index = len(self._all_lines)
@@ -149,7 +198,7 @@ def _create_file_input_controller(
     file_name: str,
 ) -> Iterator[Callable[[curses.window], FileInputController]]:
     """Create a FileInputController from a file path"""
-    with open(file_name, "r", encoding="utf-8", errors="ignore") as file:
+    with open(file_name, "rb") as file:
         yield functools.partial(FileInputController, file=file)
 
 
@@ -165,14 +214,19 @@ def _create_stdin_input_controller() -> (
         yield functools.partial(StdinInputController, input_stream=input_stream)
 
 
-def _get_pipe_input_stream() -> TextIO:
+def _get_pipe_input_stream() -> BinaryIO:
     original_stdin_fd = os.dup(0)
     flags = fcntl.fcntl(original_stdin_fd, fcntl.F_GETFL)
     fcntl.fcntl(original_stdin_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-    input_stream = os.fdopen(original_stdin_fd, "r", encoding="utf-8")
+    input_stream = os.fdopen(original_stdin_fd, "rb", buffering=0)
     return input_stream
 
 
+def _decode_lines(data: bytes) -> list[str]:
+    """Decode newline-terminated data and split it into lines without newlines"""
+    return data.decode("utf-8", errors="ignore").split("\n")[:-1]
+
+
 @contextlib.contextmanager
 def create_input_controller(
     file_name: str | None,
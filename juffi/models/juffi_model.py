@@ -1,6 +1,7 @@
 """Main state of the Juffi application"""
 
 import collections
+import operator
 from enum import Enum
 
 from juffi.helpers.curses_utils import Size
@@ -9,6 +10,8 @@ from juffi.helpers.state import Field, State
 from juffi.models.column import Column
 from juffi.models.log_entry import LogEntry
 
+_get_line_number = operator.attrgetter("line_number")
+
 
 class ViewMode(Enum):
     """Enumeration of different view modes in the application"""
@@ -43,6 +46,11 @@ class JuffiState(
     input_cursor_pos = Field[int](0)
     search_term = Field[str]("")
 
+    def __init__(self) -> None:
+        super().__init__()
+        # How many filtered entries have a non-empty value for each key
+        self._key_counts: collections.Counter[str] = collections.Counter()
+
     @property
     def filters_count(self) -> int:
         """Number of active filters"""
@@ -75,16 +83,23 @@ class JuffiState(
         """Set the entries"""
         self.entries = entries
 
-    def set_filtered_entries(self, filtered_entries: list[LogEntry]) -> None:
-        """Set the filtered entries"""
+    def set_filtered_entries(
+        self,
+        filtered_entries: list[LogEntry],
+        added_entries: list[LogEntry] | None = None,
+    ) -> None:
+        """Set the filtered entries
+
+        Pass added_entries when the previous filtered entries are all still
+        included and the added ones come later in the log, so only the added
+        ones need to be scanned for columns.
+        """
         self.filtered_entries = filtered_entries
-        self._detect_columns()
+        self._detect_columns(added_entries)
 
     def move_column(self, from_idx: int, to_idx: int) -> None:
         """Move a column"""
-        values = list(self.columns.values())
-        values.insert(to_idx, values.pop(from_idx))
-        self.columns = IndexedDict[Column]([(col.name, col) for col in values])
+        self.columns.move(from_idx, to_idx)
 
     def set_column_width(self, column: str, width: int) -> None:
         """Set the width of a column"""
@@ -108,28 +123,29 @@ class JuffiState(
 
     def get_default_sorted_columns(self) -> list[str]:
         """Get all discovered columns sorted by default priority"""
-        all_columns_list = list(self.all_discovered_columns)
-        all_columns_with_counts = {col: 1 for col in all_columns_list}
         return sorted(
-            all_columns_list,
-            key=lambda k: self._calculate_column_priority(
-                k, all_columns_with_counts[k]
-            ),
+            self.all_discovered_columns,
+            key=lambda k: self._calculate_column_priority(k, 1),
             reverse=True,
         )
 
-    def _detect_columns(self) -> None:
+    def _detect_columns(self, added_entries: list[LogEntry] | None = None) -> None:
         """Detect columns from entries data"""
-        all_keys = collections.Counter()  # type: ignore
-        all_keys.update({"#"})
+        if added_entries is None:
+            self._key_counts = collections.Counter({"#": 1})
+            # Counted in log order, so tied columns keep the order they first appear
+            added_entries = sorted(self.filtered_entries, key=_get_line_number)
 
-        for entry in self.filtered_entries:
+        all_keys = self._key_counts
+        for entry in added_entries:
             if entry.is_valid_json:
                 all_keys.update([k for k, v in entry.data.items() if v])
             else:
                 all_keys.update({"message"})
 
-        self.all_discovered_columns.update(all_keys.keys())
+        # Updating notifies watchers, so only do it when a column is new
+        if not self.all_discovered_columns.issuperset(all_keys.keys()):
+            self.all_discovered_columns.update(all_keys.keys())
 
         self.columns = IndexedDict[Column](
             (name, Column(name))
@@ -175,7 +191,11 @@ class JuffiState(
 
             for entry in self.filtered_entries:
                 value_len = len(entry.get_value(column.name))
-                max_width = max(max_width, value_len)
+                if value_len > max_width:
+                    max_width = value_len
+                    # Any longer value would be capped to the same width
+                    if max_width + 1 >= max_col_width:
+                        break
 
             content_width = max(max_width, len(column.name) + 2)
             column.width = min(content_width + 1, max_col_width)
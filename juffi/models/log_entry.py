@@ -2,44 +2,89 @@
 
 import json
 import math
+import re
 from datetime import datetime
 from types import NoneType
-from typing import Any, Type, TypeVar
+from typing import Any, Callable, Type, TypeVar
 
 from juffi.helpers.datetime_parser import try_parse_datetime
 
+_fast_loads: Callable[[str], Any] | None
+try:
+    from orjson import loads as _fast_loads
+except ImportError:  # pragma: no cover
+    _fast_loads = None
+
+# orjson turns integers wider than 64 bits into floats. Such a float can only be
+# among the top-level values or nested inside one, and the line then has the digits
+_WIDE_INT_CONTAINERS = frozenset((float, dict, list))
+_WIDE_INT = re.compile(r"[0-9]{19}")
+
 MISSING = object()
+TIMESTAMP_FIELDS = ("timestamp", "time", "@timestamp", "datetime", "date")
+_SORT_BLANKS: dict[type, Any] = {int: -math.inf, float: -math.inf}
 T = TypeVar("T")
 
 
-class LogEntry:
+def _json_loads(line: str) -> Any:
+    """Parse a line as the standard json module would, with orjson when it can"""
+    if _fast_loads is None:
+        return json.loads(line)
+    try:
+        data = _fast_loads(line)
+    except ValueError:
+        # orjson rejects NaN, Infinity and lone surrogates, which json accepts
+        return json.loads(line)
+    if (
+        isinstance(data, dict)
+        and not _WIDE_INT_CONTAINERS.isdisjoint(map(type, data.values()))
+        and _WIDE_INT.search(line)
+    ):
+        return json.loads(line)
+    return data
+
+
+class LogEntry:  # pylint: disable=too-many-instance-attributes
     """Represents a single log entry"""
 
+    __slots__ = (
+        "raw_line",
+        "line_number",
+        "data",
+        "timestamp",
+        "level",
+        "is_valid_json",
+        "_dumped_values",
+        "_search_text",
+    )
+
     def __init__(self, raw_line: str, line_number: int) -> None:
         self.raw_line: str = raw_line.strip()
         self.line_number: int = line_number
-        self.data: dict[str, Any] = {}
+        self.data: dict[str, Any]
         self.timestamp: datetime | None = None
         self.level: str | None = None
         self.is_valid_json: bool = False
-
-        try:
-            data = json.loads(self.raw_line)
-            if not isinstance(data, dict):
-                raise ValueError("Not a dictionary")
-
+        self._dumped_values: dict[str, str] | None = None
+        self._search_text: str | None = None
+
+        data = None
+        # Only a JSON object is a valid entry, so skip parsing plain text lines
+        if self.raw_line.startswith("{"):
+            try:
+                data = _json_loads(self.raw_line)
+            except ValueError:
+                pass
+
+        if isinstance(data, dict):
             self.data = data
             self.is_valid_json = True
-        except ValueError:
+            self._parse_known_fields()
+        else:
             self.data = {"message": self.raw_line}
 
-        for ts_field in [
-            "timestamp",
-            "time",
-            "@timestamp",
-            "datetime",
-            "date",
-        ]:
+    def _parse_known_fields(self) -> None:
+        for ts_field in TIMESTAMP_FIELDS:
             if ts_field in self.data:
                 ts_str = str(self.data[ts_field])
                 timestamp = try_parse_datetime(ts_str)
@@ -78,17 +123,23 @@ class LogEntry:
         if value is None:
             return "null"
         if isinstance(value, (dict, list)):
-            return json.dumps(value, ensure_ascii=False)
+            return self._get_dumped_value(key, value)
         if isinstance(value, bool):
             return "true" if value else "false"
         return str(value)
 
+    def _get_dumped_value(self, key: str, value: dict | list) -> str:
+        """Serialize a nested value once, since entry data never changes"""
+        if self._dumped_values is None:
+            self._dumped_values = {}
+        dumped = self._dumped_values.get(key)
+        if dumped is None:
+            dumped = json.dumps(value, ensure_ascii=False)
+            self._dumped_values[key] = dumped
+        return dumped
+
     def get_sortable_value(self, key: str, type_: Type[T]) -> T:
         """Get the value of a field, formatted for sorting"""
-        blank = {
-            int: -math.inf,
-            float: -math.inf,
-        }
         value = self.data.get(key, MISSING)
         result: Any
         if key == "#":
@@ -103,7 +154,7 @@ class LogEntry:
             result = "null"
 
         elif value is MISSING:
-            result = blank.get(type_, "")
+            result = _SORT_BLANKS.get(type_, "")
 
         elif type_ in (int, float):
             result = value
@@ -112,23 +163,27 @@ class LogEntry:
         return result
 
     def matches_filter(self, filters: dict[str, str]) -> bool:
-        """Check if the entry matches all the given filters"""
+        """Check if the entry matches all the given lowercased filters"""
         for key, filter_value in filters.items():
             if not filter_value:
                 continue
-            entry_value = self.get_value(key).lower()
-            if filter_value.lower() not in entry_value:
+            if filter_value not in self.get_value(key).lower():
                 return False
         return True
 
     def matches_search(self, search_term: str) -> bool:
-        """Check if the entry matches the search term"""
+        """Check if the entry matches the lowercased search term"""
         if not search_term:
             return True
-        search_lower = search_term.lower()
-
-        for value in self.data.values():
-            if search_lower in str(value).lower():
-                return True
-
-        return search_lower in self.raw_line.lower()
+        if self._search_text is None:
+            self._search_text = self._build_search_text()
+        return search_term in self._search_text
+
+    def _build_search_text(self) -> str:
+        """Lowercase the raw line and every value into one searchable string"""
+        if not self.is_valid_json:
+            return self.raw_line.lower()
+        # The separator keeps a search term from matching across two values
+        return "\x00".join(
+            [self.raw_line, *(str(value) for value in self.data.values())]
+        ).lower()
@@ -29,6 +29,10 @@ class Window(ABC):
     def clear(self) -> None:
         """Clear the window"""
 
+    @abstractmethod
+    def erase(self) -> None:
+        """Blank the window without forcing a full repaint"""
+
     @abstractmethod
     def refresh(self) -> None:
         """Refresh the window"""
@@ -106,11 +110,15 @@ class OutputController(ABC):
     def get_terminal_size(self) -> Size:
         """Get the terminal size as a Size tuple"""
 
+    @abstractmethod
+    def doupdate(self) -> None:
+        """Update the physical screen with all windows marked for refresh"""
+
 
 class CursesWindow(Window):
     """Concrete implementation of Window wrapping a curses window"""
 
-    def __init__(self, curses_window, color_to_pair: dict[Color, int]) -> None:
+    def __init__(self, curses_window, color_to_pair: tuple[int, ...]) -> None:
         self._window = curses_window
         self._color_to_pair = color_to_pair
 
@@ -140,6 +148,10 @@ class CursesWindow(Window):
         """Clear the window"""
         self._window.clear()
 
+    def erase(self) -> None:
+        """Blank the window without forcing a full repaint"""
+        self._window.erase()
+
     def refresh(self) -> None:
         """Refresh the window"""
         self._window.refresh()
@@ -159,10 +171,11 @@ class CursesWindow(Window):
         """Add a string to the window"""
         attr = 0
         if color is not None:
-            attr = self._color_to_pair.get(color, 0)
+            attr = self._color_to_pair[color]
         if attributes:
+            # TextAttribute members are the curses attribute ints themselves
             for text_attr in attributes:
-                attr |= text_attr.value
+                attr |= text_attr
 
         try:
             self._window.addstr(position.y, position.x, text, attr)
@@ -197,7 +210,8 @@ class CursesOutputController(OutputController):
 
     def __init__(self, stdscr: curses.window) -> None:
         self._stdscr = stdscr
-        self._color_to_pair: dict[Color, int] = {}
+        self._color_to_pair: tuple[int, ...] = ()
+        self._terminal_size: Size | None = None
         self._start_color()
         self._use_default_colors()
 
@@ -209,10 +223,12 @@ class CursesOutputController(OutputController):
     def _use_default_colors(self) -> None:
         """Use default terminal colors"""
         curses.use_default_colors()
+        color_to_pair = [0] * (max(Color) + 1)
         for i, color in enumerate(Color):
             pair_num = i + 1
             curses.init_pair(pair_num, color.value, -1)
-            self._color_to_pair[color] = curses.color_pair(pair_num)
+            color_to_pair[color] = curses.color_pair(pair_num)
+        self._color_to_pair = tuple(color_to_pair)
 
     def create_main_window(self) -> Window:
         """Create a Window instance wrapping the given curses window"""
@@ -220,7 +236,7 @@ class CursesOutputController(OutputController):
 
     def get_color_attr(self, color: Color) -> int:
         """Get the color attribute for a Color enum"""
-        return self._color_to_pair.get(color, 0)
+        return self._color_to_pair[color]
 
     def curs_set(self, visibility: int) -> None:
         """Set cursor visibility"""
@@ -229,15 +245,24 @@ class CursesOutputController(OutputController):
     def update_lines_cols(self) -> None:
         """Update LINES and COLS after terminal resize"""
         curses.update_lines_cols()
+        self._terminal_size = None
 
     def get_lines(self) -> int:
         """Get the number of lines in the terminal"""
-        return curses.LINES  # pylint: disable=no-member
+        return self.get_terminal_size().height
 
     def get_cols(self) -> int:
         """Get the number of columns in the terminal"""
-        return curses.COLS  # pylint: disable=no-member
+        return self.get_terminal_size().width
 
     def get_terminal_size(self) -> Size:
-        """Get the terminal size as a Size tuple"""
-        return Size(curses.LINES, curses.COLS)  # pylint: disable=no-member
+        """Get the terminal size as a Size tuple, cached until the next resize"""
+        if self._terminal_size is None:
+            self._terminal_size = Size(
+                curses.LINES, curses.COLS  # pylint: disable=no-member
+            )
+        return self._terminal_size
+
+    def doupdate(self) -> None:
+        """Update the physical screen with all windows marked for refresh"""
+        curses.doupdate()
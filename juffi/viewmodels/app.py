@@ -1,7 +1,8 @@
 """App viewmodel - handles business logic and state management"""
 
 import logging
-from typing import Callable
+from itertools import islice
+from typing import Any, Callable, Iterable, NamedTuple
 
 from juffi.helpers.curses_utils import Size
 from juffi.input_controller import InputController
@@ -10,6 +11,29 @@ from juffi.models.log_entry import LogEntry
 
 logger = logging.getLogger(__name__)
 
+# Beyond this many new matches, re-sorting beats inserting them one by one
+_MAX_INSERTED_ENTRIES = 256
+
+
+class _FilterMatch(NamedTuple):
+    """Entries matching a query, in load order, among the scanned entries"""
+
+    entries: list[LogEntry]
+    filters: dict[str, str]
+    search_term: str
+    num_scanned: int
+    last_entry: LogEntry | None
+    # Entries matching the filters alone, when they are known
+    filter_matches: list[LogEntry] | None
+
+
+class _SortKeys(NamedTuple):
+    """Sort keys of the loaded entries for one column, in load order"""
+
+    column: str
+    column_type: type
+    keys: list[Any]
+
 
 class AppModel:
     """ViewModel class for the Juffi application"""
@@ -24,6 +48,9 @@ class AppModel:
         self._input_controller = input_controller
         self._column_types: dict[str, type] = {"#": int}
         self._initial_sort_reversed: bool | None = None
+        self._last_match = _FilterMatch([], {}, "", 0, None, None)
+        self._sort_keys = _SortKeys("", str, [])
+        self._sorted_by: tuple[str, type | None, bool] | None = None
         self._state.register_watcher("terminal_size", size_update)
 
     def update_terminal_size(self, size: Size) -> None:
@@ -41,6 +68,7 @@ class AppModel:
             else True
         )
         self._state.clear_entries()
+        self._sort_keys = _SortKeys("", str, [])
         self._input_controller.reset()
         self.load_entries()
 
@@ -58,13 +86,18 @@ class AppModel:
         new_entries: list[LogEntry] = []
         line_number: int = len(self._state.entries) + 1
 
+        # Bound once, as this loop runs for every line of the input
+        from_line = LogEntry.from_line
+        append_entry = new_entries.append
+        combine_types = self._combine_types
         for line in self._input_controller.get_data():
-            if line.strip():
-                entry, types = LogEntry.from_line(line, line_number)
-                new_entries.append(entry)
+            # isspace scans without allocating a stripped copy, but is False for ""
+            if line and not line.isspace():
+                entry, types = from_line(line, line_number)
+                append_entry(entry)
                 line_number += 1
 
-                self._combine_types(types)
+                combine_types(types)
 
         self._state.extend_entries(new_entries)
 
@@ -73,6 +106,9 @@ class AppModel:
             self._initial_sort_reversed = self._state.sort_reverse
 
     def _combine_types(self, new_types: dict[str, type]) -> None:
+        # Once the schema settles most lines add nothing, which one C-level check finds
+        if new_types.items() <= self._column_types.items():
+            return
         for key, value_type in new_types.items():
             if key not in self._column_types:
                 self._column_types[key] = value_type
@@ -86,21 +122,188 @@ class AppModel:
 
     def apply_filters(self) -> None:
         """Temp"""
-        filtered_entries = []
-
-        for entry in self._state.entries:
-            if entry.matches_filter(self._state.filters) and entry.matches_search(
-                self._state.search_term
-            ):
-                filtered_entries.append(entry)
-
-        if self._state.sort_column:
-            filtered_entries.sort(
-                key=lambda e: e.get_sortable_value(
-                    self._state.sort_column,
-                    self._column_types[self._state.sort_column],
-                ),
-                reverse=self._state.sort_reverse,
+        filters = {key: value.lower() for key, value in self._state.filters.items()}
+        search_term = self._state.search_term.lower()
+        # Prepared once per query rather than per entry
+        active_filters = {key: value for key, value in filters.items() if value}
+
+        extends_last_scan = self._extends_last_scan()
+        narrows_last_match = extends_last_scan and self._narrows_last_match(
+            filters, search_term
+        )
+        same_query = (
+            narrows_last_match
+            and filters == self._last_match.filters
+            and search_term == self._last_match.search_term
+        )
+        # A new search under the same filters only needs the search re-checked
+        known_filter_matches = (
+            self._last_match.filter_matches
+            if extends_last_scan and filters == self._last_match.filters
+            else None
+        )
+        kept_matches: list[LogEntry] = []
+        new_entries: list[LogEntry] = self._state.entries
+        if narrows_last_match or known_filter_matches is not None:
+            new_entries = self._state.entries[self._last_match.num_scanned :]
+        if narrows_last_match:
+            # With an unchanged query every previous match still matches
+            kept_matches = self._last_match.entries
+            if not same_query:
+                kept_matches = _matching_entries(
+                    kept_matches, active_filters, search_term
+                )
+        elif known_filter_matches is not None:
+            kept_matches = _matching_entries(known_filter_matches, {}, search_term)
+        new_matches = _matching_entries(new_entries, active_filters, search_term)
+        matched_entries = kept_matches + new_matches
+
+        filter_matches = None
+        if not search_term:
+            filter_matches = matched_entries
+        elif known_filter_matches is not None:
+            filter_matches = known_filter_matches + _matching_entries(
+                new_entries, active_filters, ""
+            )
+        self._last_match = _FilterMatch(
+            matched_entries,
+            filters,
+            search_term,
+            len(self._state.entries),
+            self._state.entries[-1] if self._state.entries else None,
+            filter_matches,
+        )
+
+        sorted_by = (
+            self._state.sort_column,
+            self._column_types.get(self._state.sort_column),
+            self._state.sort_reverse,
+        )
+        if narrows_last_match and sorted_by == self._sorted_by:
+            # The filtered entries are sorted already, so they only need merging
+            filtered_entries = self._merged_entries(
+                self._kept_filtered_entries(kept_matches), new_matches
+            )
+        else:
+            filtered_entries = self._sorted_entries(matched_entries)
+        self._sorted_by = sorted_by
+
+        # An unchanged query keeps every previous match, ahead of any new ones
+        self._state.set_filtered_entries(
+            filtered_entries, new_matches if same_query else None
+        )
+
+    def _kept_filtered_entries(self, kept_matches: list[LogEntry]) -> list[LogEntry]:
+        """Get the filtered entries that are still matched, in their current order"""
+        if len(kept_matches) == len(self._state.filtered_entries):
+            return list(self._state.filtered_entries)
+        kept = set(kept_matches)
+        return [entry for entry in self._state.filtered_entries if entry in kept]
+
+    def _merged_entries(
+        self, entries: list[LogEntry], added_entries: list[LogEntry]
+    ) -> list[LogEntry]:
+        """Merge new matches into entries which are already sorted"""
+        sort_column = self._state.sort_column
+        sort_reverse = self._state.sort_reverse
+        if not sort_column or (sort_column == "#" and not sort_reverse):
+            entries.extend(added_entries)
+        elif sort_column == "#":
+            entries[:0] = reversed(added_entries)
+        elif len(added_entries) > _MAX_INSERTED_ENTRIES:
+            # The sorted prefix is a single run, so this sort is close to linear
+            entries.extend(added_entries)
+            entries = self._sorted_entries(entries)
+        else:
+            keys = self._get_sort_keys(sort_column, self._column_types[sort_column])
+            for entry in added_entries:
+                _insert_sorted(entries, entry, keys, sort_reverse)
+        return entries
+
+    def _sorted_entries(self, entries: list[LogEntry]) -> list[LogEntry]:
+        sort_column = self._state.sort_column
+        if not sort_column:
+            return list(entries)
+
+        # Entries are kept in load order, which is already line number order
+        if sort_column == "#":
+            return entries[::-1] if self._state.sort_reverse else list(entries)
+
+        # An entry's line number is its position in the loaded entries
+        keys = self._get_sort_keys(sort_column, self._column_types[sort_column])
+        return sorted(
+            entries,
+            key=lambda e: keys[e.line_number - 1],
+            reverse=self._state.sort_reverse,
+        )
+
+    def _get_sort_keys(self, sort_column: str, column_type: type) -> list[Any]:
+        """Get the sort keys of all loaded entries, computing only missing ones"""
+        sort_keys = self._sort_keys
+        if sort_keys.column != sort_column or sort_keys.column_type is not column_type:
+            sort_keys = self._sort_keys = _SortKeys(sort_column, column_type, [])
+
+        keys = sort_keys.keys
+        entries = self._state.entries
+        if len(keys) < len(entries):
+            keys.extend(
+                entry.get_sortable_value(sort_column, column_type)
+                for entry in islice(entries, len(keys), None)
             )
+        return keys
+
+    def _extends_last_scan(self) -> bool:
+        """Check if the entries scanned by the last query are still loaded"""
+        last_match = self._last_match
+        entries = self._state.entries
+        if not last_match.num_scanned or len(entries) < last_match.num_scanned:
+            return False
+        # A reset reloads the entries, so the old matches no longer apply
+        return entries[last_match.num_scanned - 1] is last_match.last_entry
+
+    def _narrows_last_match(self, filters: dict[str, str], search_term: str) -> bool:
+        """Check if every entry matching the new query also matched the last one
+
+        Filters and search are case-insensitive substring checks, so a query
+        containing the previous one can only match a subset of its entries.
+        """
+        last_match = self._last_match
+        if last_match.search_term not in search_term:
+            return False
+        return all(
+            old_value in filters.get(key, "")
+            for key, old_value in last_match.filters.items()
+        )
+
+
+def _insert_sorted(
+    entries: list[LogEntry], entry: LogEntry, keys: list[Any], reverse: bool
+) -> None:
+    """Insert an entry after all entries with an equal sort key"""
+    key = keys[entry.line_number - 1]
+    low, high = 0, len(entries)
+    while low < high:
+        mid = (low + high) // 2
+        mid_key = keys[entries[mid].line_number - 1]
+        if (mid_key < key) if reverse else (key < mid_key):
+            high = mid
+        else:
+            low = mid + 1
+    entries.insert(low, entry)
+
 
-        self._state.set_filtered_entries(filtered_entries)
+def _matching_entries(
+    entries: Iterable[LogEntry], filters: dict[str, str], search_term: str
+) -> list[LogEntry]:
+    """Get the entries matching lowercased filters and search term"""
+    if not filters:
+        if not search_term:
+            return list(entries)
+        return [entry for entry in entries if entry.matches_search(search_term)]
+    if not search_term:
+        return [entry for entry in entries if entry.matches_filter(filters)]
+    return [
+        entry
+        for entry in entries
+        if entry.matches_filter(filters) and entry.matches_search(search_term)
+    ]
@@ -106,19 +106,18 @@ class BrowseViewModel:
 
     def handle_input_backspace(self) -> None:
         """Handle backspace in input mode"""
-        if self._state.input_cursor_pos > 0:
-            self._state.input_buffer = (
-                self._state.input_buffer[: self._state.input_cursor_pos - 1]
-                + self._state.input_buffer[self._state.input_cursor_pos :]
-            )
-            self._state.input_cursor_pos -= 1
+        pos = self._state.input_cursor_pos
+        if pos > 0:
+            buffer = self._state.input_buffer
+            self._state.input_buffer = buffer[: pos - 1] + buffer[pos:]
+            self._state.input_cursor_pos = pos - 1
 
     def handle_input_delete(self) -> None:
         """Handle delete key in input mode"""
-        self._state.input_buffer = (
-            self._state.input_buffer[: self._state.input_cursor_pos]
-            + self._state.input_buffer[self._state.input_cursor_pos + 1 :]
-        )
+        pos = self._state.input_cursor_pos
+        buffer = self._state.input_buffer
+        if pos < len(buffer):
+            self._state.input_buffer = buffer[:pos] + buffer[pos + 1 :]
 
     def handle_input_cursor_left(self) -> None:
         """Handle left arrow in input mode"""
@@ -132,12 +131,13 @@ class BrowseViewModel:
 
     def handle_input_character(self, char: str) -> None:
         """Handle character input in input mode"""
-        self._state.input_buffer = (
-            self._state.input_buffer[: self._state.input_cursor_pos]
-            + char
-            + self._state.input_buffer[self._state.input_cursor_pos :]
-        )
-        self._state.input_cursor_pos += 1
+        pos = self._state.input_cursor_pos
+        buffer = self._state.input_buffer
+        if pos == len(buffer):
+            self._state.input_buffer = buffer + char
+        else:
+            self._state.input_buffer = buffer[:pos] + char + buffer[pos:]
+        self._state.input_cursor_pos = pos + 1
 
     def _clear_input_state(self) -> None:
         """Clear input mode state"""
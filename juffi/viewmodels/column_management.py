@@ -1,5 +1,6 @@
 """Column management viewmodel - handles business logic and state management"""
 
+import bisect
 import enum
 from typing import Literal
 
@@ -15,6 +16,9 @@ class ButtonActions(enum.Enum):
     RESET = "Reset"
 
 
+_BUTTON_ORDER = tuple(ButtonActions)
+
+
 class ColumnManagementViewModel:  # pylint: disable=too-many-instance-attributes
     """View-model for column management logic, separate from UI concerns"""
 
@@ -106,9 +110,9 @@ class ColumnManagementViewModel:  # pylint: disable=too-many-instance-attributes
         self._pane_manager.move_selection(delta)
 
     def _move_button(self, delta):
-        current_index = list(ButtonActions).index(self._button_selection)
-        new_index = max(0, min(2, current_index + delta))
-        self._button_selection = list(ButtonActions)[new_index]
+        current_index = _BUTTON_ORDER.index(self._button_selection)
+        new_index = max(0, min(len(_BUTTON_ORDER) - 1, current_index + delta))
+        self._button_selection = _BUTTON_ORDER[new_index]
 
 
 class PaneManager:
@@ -141,11 +145,11 @@ class PaneManager:
         # Update all_columns with any new columns from the current visible set
         self._all_columns.update(currently_selected)
 
-        self.selected_columns = currently_selected.copy()
-        self.available_columns = [
-            col for col in self._all_columns if col not in currently_selected
-        ]
-        self.available_columns.sort()  # Keep available columns sorted
+        self.selected_columns = currently_selected
+        # Keep available columns sorted
+        self.available_columns = sorted(
+            self._all_columns.difference(currently_selected)
+        )
 
         # Reset selections
         self._focused_pane = "available"
@@ -155,20 +159,17 @@ class PaneManager:
 
     def update_all_columns(self, new_columns: set[str]) -> None:
         """Update the set of all discovered columns"""
-        old_available = set(self.available_columns)
-        self._all_columns.update(new_columns)
-
-        # Update available columns with any new columns not currently selected
-        self.available_columns = [
-            col for col in self._all_columns if col not in self.selected_columns
-        ]
-        self.available_columns.sort()
+        # Once parsing has settled, nothing new is discovered
+        if self._all_columns.issuperset(new_columns):
+            return
+        added = [col for col in new_columns if col not in self._all_columns]
+        self._all_columns.update(added)
 
-        # Adjust available selection if the list changed
-        if set(self.available_columns) != old_available and self.available_columns:
-            self.available_selection = min(
-                self.available_selection, len(self.available_columns) - 1
-            )
+        # Insert only the newly discovered columns, keeping available sorted
+        selected = set(self.selected_columns)
+        for col in added:
+            if col not in selected:
+                bisect.insort(self.available_columns, col)
 
     def reset_to_default(self, sorted_columns: list[str]) -> None:
         """Reset column management to default state with provided sorted columns"""
@@ -204,14 +205,16 @@ class PaneManager:
         column = self._selected_column
 
         # Only move if it's currently in selected list
-        if column in self.selected_columns:
-            self.selected_columns.remove(column)
-            self.available_columns.append(column)
-            self.available_columns.sort()  # Keep available sorted
+        index = _index_of(self.selected_columns, column)
+        if index is not None:
+            del self.selected_columns[index]
+            # Keep available sorted
+            available_index = bisect.bisect_left(self.available_columns, column)
+            self.available_columns.insert(available_index, column)
 
             # Update selections and focus
             self._focused_pane = "available"
-            self.available_selection = self.available_columns.index(column)
+            self.available_selection = available_index
 
             # Adjust selected selection if needed
             if (
@@ -228,8 +231,9 @@ class PaneManager:
         column = self._selected_column
 
         # Only move if it's currently in available list
-        if column in self.available_columns:
-            self.available_columns.remove(column)
+        index = _index_of(self.available_columns, column)
+        if index is not None:
+            del self.available_columns[index]
             self.selected_columns.append(column)
 
             # Update selections and focus
@@ -314,23 +318,31 @@ class PaneManager:
 
         column = self._selected_column
 
-        # Find which list contains the selected column
-        if column in self.available_columns:
-            items = self.available_columns
-            current_idx = items.index(column)
-            new_idx = max(0, min(len(items) - 1, current_idx + delta))
-
-            if new_idx != current_idx:
-                # Move the column
+        # Find which list contains the selected column, scanning each at most once
+        items = self.available_columns
+        current_idx = _index_of(items, column)
+        if current_idx is None:
+            items = self.selected_columns
+            current_idx = _index_of(items, column)
+            if current_idx is None:
+                return
+
+        new_idx = max(0, min(len(items) - 1, current_idx + delta))
+        if new_idx != current_idx:
+            # Move the column, by swapping neighbours for a single step
+            if abs(new_idx - current_idx) == 1:
+                items[current_idx], items[new_idx] = items[new_idx], items[current_idx]
+            else:
                 items.insert(new_idx, items.pop(current_idx))
+            if items is self.available_columns:
                 self.available_selection = new_idx
+            else:
+                self.selected_selection = new_idx
 
-        elif column in self.selected_columns:
-            items = self.selected_columns
-            current_idx = items.index(column)
-            new_idx = max(0, min(len(items) - 1, current_idx + delta))
 
-            if new_idx != current_idx:
-                # Move the column
-                items.insert(new_idx, items.pop(current_idx))
-                self.selected_selection = new_idx
+def _index_of(columns: list[str], column: str) -> int | None:
+    """Get the position of a column in a list, or None if it is not there"""
+    try:
+        return columns.index(column)
+    except ValueError:
+        return None
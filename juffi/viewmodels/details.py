@@ -4,7 +4,7 @@ from juffi.models.juffi_model import JuffiState
 from juffi.models.log_entry import LogEntry
 
 
-class DetailsViewModel:
+class DetailsViewModel:  # pylint: disable=too-many-instance-attributes
     """Handles details mode business logic and state management"""
 
     def __init__(
@@ -19,6 +19,11 @@ class DetailsViewModel:
         self._intended_field_position: int = 0
         self._in_fullscreen_mode: bool = False
         self._field_content_scroll_offset: int = 0
+        # Fields of the last entry asked for, reused across redraws
+        self._fields_cache: tuple[LogEntry | None, list[tuple[str, str]]] = (
+            None,
+            [],
+        )
 
     @property
     def field_count(self) -> int:
@@ -156,9 +161,17 @@ class DetailsViewModel:
         self._in_fullscreen_mode = False
         self._field_content_scroll_offset = 0
 
+    def _get_entry_fields(self, entry: LogEntry) -> list[tuple[str, str]]:
+        """Get all fields from the entry, cached for the last entry"""
+        cached_entry, fields = self._fields_cache
+        if entry is not cached_entry:
+            fields = self._build_entry_fields(entry)
+            self._fields_cache = (entry, fields)
+        return fields
+
     @staticmethod
-    def _get_entry_fields(entry: LogEntry) -> list[tuple[str, str]]:
-        """Get all fields from the entry (excluding missing ones)"""
+    def _build_entry_fields(entry: LogEntry) -> list[tuple[str, str]]:
+        """Build all fields from the entry (excluding missing ones)"""
         fields = []
         if entry.is_valid_json:
             for key in sorted(entry.data.keys()):
@@ -3,6 +3,7 @@
 import curses
 import logging
 
+from juffi.helpers.list_utils import find_first_index
 from juffi.models.juffi_model import JuffiState
 
 logger = logging.getLogger(__name__)
@@ -50,11 +51,10 @@ class EntriesModel:
             else:
                 self._state.current_row = max(0, len(self._state.filtered_entries) - 1)
         elif current_line_number is not None:
-            new_row = None
-            for idx, entry in enumerate(self._state.filtered_entries):
-                if entry.line_number == current_line_number:
-                    new_row = idx
-                    break
+            new_row = find_first_index(
+                self._state.filtered_entries,
+                lambda entry: entry.line_number == current_line_number,
+            )
 
             if new_row is not None:
                 self._state.current_row = new_row
@@ -27,6 +27,8 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
 
     HEADER_HEIGHT = 2
     FOOTER_HEIGHT = 2
+    MIN_POLL_DELAY = 10
+    MAX_POLL_DELAY = 250
 
     def __init__(
         self,
@@ -39,8 +41,9 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
         self._input_controller = input_controller
         self._output_controller = output_controller
         self._needs_header_redraw = True
-        self._needs_footer_redraw = True
         self._needs_resize = True
+        self._poll_delay = self.MIN_POLL_DELAY
+        self._status_cache: tuple[tuple, str] = ((), "")
         self._state = JuffiState()
         self._model = AppModel(
             self._state,
@@ -48,18 +51,18 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
             size_update=self._update_needs_resize,
         )
 
-        width = self._output_controller.get_cols()
+        footer_start, entries_height, width = self._get_layout()
 
         self._header_win: Window = stdscr.derwin(
-            Viewport(Position(0, 0), Size(self.HEADER_HEIGHT, width))
+            Viewport(0, 0, self.HEADER_HEIGHT, width)
         )
 
         self._entries_win: Window = stdscr.derwin(
-            Viewport(Position(self.HEADER_HEIGHT, 0), Size(self._entries_height, width))
+            Viewport(self.HEADER_HEIGHT, 0, entries_height, width)
         )
 
         self._footer_win: Window = stdscr.derwin(
-            Viewport(Position(self._footer_start, 0), Size(self.FOOTER_HEIGHT, width))
+            Viewport(footer_start, 0, self.FOOTER_HEIGHT, width)
         )
 
         self._entries_window = EntriesWindow(self._state, self._entries_win)
@@ -97,31 +100,31 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
 
     def _reset(self) -> None:
         self._model.reset()
+        # The selection is reset against the reloaded entries, not the stale ones
+        self._model.apply_filters()
         self._entries_window.reset()
         self._state.current_mode = ViewMode.BROWSE
-        self._apply_filters(preserve_line=False)
+        self._entries_window.set_data()
 
     def _resize_windows(self) -> None:
         """Resize all windows to fit the new terminal size"""
 
-        width = self._output_controller.get_cols()
+        footer_start, entries_height, width = self._get_layout()
         self._header_win.resize(Size(self.HEADER_HEIGHT, width))
         self._header_win.mvderwin(Position(0, 0))
 
-        self._entries_win.resize(Size(self._entries_height, width))
+        self._entries_win.resize(Size(entries_height, width))
         self._entries_win.mvderwin(Position(self.HEADER_HEIGHT, 0))
 
-        self._footer_win.mvderwin(Position(self._footer_start, 0))
+        self._footer_win.mvderwin(Position(footer_start, 0))
         self._footer_win.resize(Size(self.FOOTER_HEIGHT, width))
         self._entries_window.resize()
 
-    @property
-    def _footer_start(self):
-        return self._output_controller.get_lines() - self.FOOTER_HEIGHT
-
-    @property
-    def _entries_height(self):
-        return self._footer_start - self.HEADER_HEIGHT
+    def _get_layout(self) -> tuple[int, int, int]:
+        """Get the footer start row, entries height and width from one size read"""
+        height, width = self._output_controller.get_terminal_size()
+        footer_start = height - self.FOOTER_HEIGHT
+        return footer_start, footer_start - self.HEADER_HEIGHT, width
 
     def _draw_header(self) -> None:
         size = self._header_win.getmaxyx()
@@ -136,17 +139,15 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
             Position(1, 1), "─" * (size.width - 2), color=Color.HEADER
         )
 
-        self._header_win.refresh()
+        self._header_win.noutrefresh()
 
     def _draw_footer(self) -> None:
         size = self._footer_win.getmaxyx()
         self._footer_win.clear()
 
-        status = self._get_status_line()
+        status = self._get_status_line(size.width - 2)
 
-        self._footer_win.addstr(
-            Position(0, 1), status[: size.width - 2], color=Color.INFO
-        )
+        self._footer_win.addstr(Position(0, 1), status, color=Color.INFO)
 
         if self._state.input_mode:
             visible_prompt, input_text = self._get_prompt_and_input_text(size.width)
@@ -161,7 +162,7 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
         else:
             self._output_controller.curs_set(0)
 
-        self._footer_win.refresh()
+        self._footer_win.noutrefresh()
 
     def _get_prompt_and_input_text(self, width):
         prompt = ""
@@ -177,46 +178,66 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
 
         return visible_prompt, input_text
 
-    def _get_status_line(self):
+    def _get_status_line(self, max_width: int) -> str:
+        state = self._state
+        key = (
+            max_width,
+            state.current_mode == ViewMode.DETAILS,
+            state.follow_mode,
+            state.current_row,
+            len(state.filtered_entries),
+            state.sort_column,
+            state.sort_reverse,
+            state.filters_count,
+        )
+        if key == self._status_cache[0]:
+            return self._status_cache[1]
+
         status_parts = []
-        if self._state.current_mode == ViewMode.DETAILS:
+        if state.current_mode == ViewMode.DETAILS:
             status_parts.append("DETAILS")
-        if self._state.follow_mode:
+        if state.follow_mode:
             status_parts.append("FOLLOW")
-        if self._state.filtered_entries:
+        if state.filtered_entries:
             status_parts.append(
-                f"Row {self._state.current_row + 1}/{len(self._state.filtered_entries)}"
+                f"Row {(state.current_row or 0) + 1}/{len(state.filtered_entries)}"
             )
         else:
             status_parts.append("No entries")
 
-        if self._state.sort_column:
-            direction = "DESC" if self._state.sort_reverse else "ASC"
-            status_parts.append(f"Sort: {self._state.sort_column} {direction}")
+        if state.sort_column:
+            direction = "DESC" if state.sort_reverse else "ASC"
+            status_parts.append(f"Sort: {state.sort_column} {direction}")
 
-        if self._state.filters_count > 0:
-            status_parts.append(f"Filters: {self._state.filters_count}")
+        if state.filters_count > 0:
+            status_parts.append(f"Filters: {state.filters_count}")
 
         status_parts.append("Press 'h' for help")
-        status = " | ".join(status_parts)
+        status = " | ".join(status_parts)[:max_width]
+        self._status_cache = (key, status)
         return status
 
     def run(self) -> None:  # pylint: disable=too-many-branches
         """Main TUI loop"""
         self._state.terminal_size = self._output_controller.get_terminal_size()
         self._output_controller.curs_set(0)
-        self._input_controller.timeout(10)
+        self._input_controller.timeout(self._poll_delay)
 
         with measure(logger, "draw"):
             self._draw()
 
         while True:
             key = self._input_controller.get_input()
-            with measure(logger, f"handle_input on key {key}"):
+            with measure(logger, "handle_input on key %d", key):
                 should_redraw = self._handle_input(key)
 
             if "follow_mode" in self._state.changes:
-                self._input_controller.timeout(10 if self._state.follow_mode else -1)
+                self._poll_delay = self.MIN_POLL_DELAY
+                self._input_controller.timeout(
+                    self._poll_delay if self._state.follow_mode else -1
+                )
+            elif key == -1:
+                self._update_poll_delay(got_new_entries=should_redraw)
 
             if should_redraw:
                 with measure(logger, "draw"):
@@ -224,6 +245,17 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
 
             self._state.clear_changes()
 
+    def _update_poll_delay(self, got_new_entries: bool) -> None:
+        """Back off polling for new entries while the input is idle"""
+        if got_new_entries:
+            poll_delay = self.MIN_POLL_DELAY
+        else:
+            poll_delay = min(self._poll_delay * 2, self.MAX_POLL_DELAY)
+
+        if poll_delay != self._poll_delay:
+            self._poll_delay = poll_delay
+            self._input_controller.timeout(poll_delay)
+
     def _handle_input(self, key: int):
         if key == -1:
             preserve_line = self._state.current_mode == ViewMode.DETAILS
@@ -266,8 +298,12 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
         if self._needs_resize:
             self._resize_windows()
             self._needs_resize = False
+            self._needs_header_redraw = True
 
-        self._draw_header()
+        # The header only depends on the width, but full-screen modes draw over it
+        if self._needs_header_redraw or "current_mode" in self._state.changes:
+            self._draw_header()
+            self._needs_header_redraw = False
 
         if self._state.current_mode == ViewMode.HELP:
             self._help_mode.draw(self._stdscr)
@@ -279,6 +315,7 @@ class App:  # pylint: disable=too-many-instance-attributes,too-few-public-method
             self._details_mode.draw(self._state.filtered_entries)
 
         self._draw_footer()
+        self._output_controller.doupdate()
 
     def _switch_mode(self, key: int) -> None:
         previous_mode = self._state.current_mode
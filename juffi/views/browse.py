@@ -33,40 +33,44 @@ class BrowseMode:
             on_reset=on_reset,
         )
 
-    def handle_input(self, key: int) -> None:  # pylint: disable=too-many-branches
+        # Looked up once per key, instead of comparing against every command key
+        self._key_actions: dict[int, Callable[[], None]] = {
+            ord("/"): self.viewmodel.handle_search_command,
+            ord("f"): self._handle_filter_command,
+            ord("g"): self.viewmodel.handle_goto_command,
+            ord("c"): self.viewmodel.handle_clear_filters_command,
+            ord("s"): lambda: self._handle_sort_command(reverse=False),
+            ord("S"): lambda: self._handle_sort_command(reverse=True),
+            ord("<"): lambda: self.entries_window.move_column(to_the_right=False),
+            ord(">"): lambda: self.entries_window.move_column(to_the_right=True),
+            ord("w"): lambda: self.entries_window.adjust_column_width(-5),
+            ord("W"): lambda: self.entries_window.adjust_column_width(5),
+            ord("F"): self.viewmodel.handle_toggle_follow_command,
+            ord("r"): self.viewmodel.handle_reload_command,
+        }
+
+    def handle_input(self, key: int) -> None:
         """Handle input for browse mode, delegating business logic to viewmodel"""
         if self._state.input_mode:
             self._handle_input_submode(key)
-        elif key == ord("/"):
-            self.viewmodel.handle_search_command()
-        elif key == ord("f"):
-            current_col = self.entries_window.get_current_column()
-            self.viewmodel.handle_filter_command(current_col)
-        elif key == ord("g"):
-            self.viewmodel.handle_goto_command()
-        elif key == ord("c"):
-            self.viewmodel.handle_clear_filters_command()
-        elif key == ord("s"):
-            current_col = self.entries_window.get_current_column()
-            self.viewmodel.handle_sort_command(current_col, reverse=False)
-        elif key == ord("S"):
-            current_col = self.entries_window.get_current_column()
-            self.viewmodel.handle_sort_command(current_col, reverse=True)
-        elif key == ord("<"):
-            self.entries_window.move_column(to_the_right=False)
-        elif key == ord(">"):
-            self.entries_window.move_column(to_the_right=True)
-        elif key == ord("w"):
-            self.entries_window.adjust_column_width(-5)
-        elif key == ord("W"):
-            self.entries_window.adjust_column_width(5)
-        elif key == ord("F"):
-            self.viewmodel.handle_toggle_follow_command()
-        elif key == ord("r"):
-            self.viewmodel.handle_reload_command()
+            return
+
+        action = self._key_actions.get(key)
+        if action is not None:
+            action()
         else:
             self.entries_window.handle_navigation(key)
 
+    def _handle_filter_command(self) -> None:
+        """Start filtering on the current column"""
+        current_col = self.entries_window.get_current_column()
+        self.viewmodel.handle_filter_command(current_col)
+
+    def _handle_sort_command(self, reverse: bool) -> None:
+        """Sort by the current column"""
+        current_col = self.entries_window.get_current_column()
+        self.viewmodel.handle_sort_command(current_col, reverse=reverse)
+
     def _handle_input_submode(self, key: int) -> None:
         """Handle input for search/filter/goto submodes, delegating to viewmodel"""
         if key == ESC:
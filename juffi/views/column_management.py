@@ -3,11 +3,22 @@
 import curses
 import textwrap
 
-from juffi.helpers.curses_utils import Color, Position, Size, TextAttribute, Viewport
+from juffi.helpers.curses_utils import Color, Position, TextAttribute, Viewport
 from juffi.models.juffi_model import JuffiState
 from juffi.output_controller import Window
 from juffi.viewmodels.column_management import ButtonActions, ColumnManagementViewModel
 
+_BUTTON_WIDTH = 10
+_BUTTON_GAP = 2
+_BUTTONS_TOTAL_WIDTH = (
+    len(ButtonActions) * _BUTTON_WIDTH + (len(ButtonActions) - 1) * _BUTTON_GAP
+)
+# Each button with its label and x offset from the start of the button row
+_BUTTON_LAYOUT = tuple(
+    (button, f"[{button.value:^8}]", i * (_BUTTON_WIDTH + _BUTTON_GAP))
+    for i, button in enumerate(ButtonActions)
+)
+
 
 class ColumnManagementMode:
     """Handles the column management screen"""
@@ -20,6 +31,7 @@ class ColumnManagementMode:
         self._state = state
         self._window = window
         self._view_model = ColumnManagementViewModel()
+        self._needs_clear = True
 
         # Set up watcher to update view-model when new columns are discovered
         self._state.register_watcher(
@@ -28,6 +40,7 @@ class ColumnManagementMode:
 
     def enter_mode(self) -> None:
         """Called when entering column management mode"""
+        self._needs_clear = True
         self._view_model.initialize_from_columns(
             self._state.columns, self._state.all_discovered_columns.copy()
         )
@@ -73,7 +86,12 @@ class ColumnManagementMode:
     def draw(self) -> None:
         """Draw the column management screen"""
         size = self._window.getmaxyx()
-        self._window.clear()
+        # Only the first frame repaints the whole screen, later ones are diffed
+        if self._needs_clear:
+            self._window.clear()
+            self._needs_clear = False
+        else:
+            self._window.erase()
 
         header_lines = self._draw_header(size.width)
         pane_width = max(10, (size.width - 6) // 2)
@@ -85,31 +103,31 @@ class ColumnManagementMode:
         # Draw available columns pane
         self._draw_pane(
             "Available Columns",
-            Viewport(Position(pane_y, left_x), Size(pane_height, pane_width)),
+            Viewport(pane_y, left_x, pane_height, pane_width),
             self._view_model.is_pane_focused("available"),
         )
         self._draw_pane_items(
             self._view_model.is_pane_focused("available"),
             self._view_model.get_available_columns(),
-            Viewport(Position(pane_y, left_x), size),
+            Viewport(pane_y, left_x, size.height, size.width),
         )
 
         # Draw selected columns pane
         self._draw_pane(
             "Selected Columns",
-            Viewport(Position(pane_y, right_x), Size(pane_height, pane_width)),
+            Viewport(pane_y, right_x, pane_height, pane_width),
             self._view_model.is_pane_focused("selected"),
         )
         self._draw_pane_items(
             self._view_model.is_pane_focused("selected"),
             self._view_model.get_selected_columns(),
-            Viewport(Position(pane_y, right_x), size),
+            Viewport(pane_y, right_x, size.height, size.width),
         )
 
         # Draw buttons
         self._draw_buttons(size.height - 3, size.width)
 
-        self._window.refresh()
+        self._window.noutrefresh()
 
     def _draw_header(self, width: int) -> int:
         title = "Column Management"
@@ -144,28 +162,27 @@ class ColumnManagementMode:
     ) -> None:
         """Draw a pane with title, border, and items"""
         border_color = Color.SELECTED if is_focused else Color.DEFAULT
+        inner_width = viewport.width - 2
 
         self._window.addstr(
             Position(viewport.y, viewport.x),
-            "┌" + "─" * (viewport.width - 2) + "┐",
+            "┌" + "─" * inner_width + "┐",
             color=border_color,
         )
 
         title_x = viewport.x + (viewport.width - len(title)) // 2
         self._window.addstr(Position(viewport.y, title_x), title, color=Color.HEADER)
+
+        # Both side borders in one call per row; items are drawn over the gap
+        side_row = "│" + " " * inner_width + "│"
         for i in range(1, viewport.height - 1):
             self._window.addstr(
-                Position(viewport.y + i, viewport.x), "│", color=border_color
-            )
-            self._window.addstr(
-                Position(viewport.y + i, viewport.x + viewport.width - 1),
-                "│",
-                color=border_color,
+                Position(viewport.y + i, viewport.x), side_row, color=border_color
             )
 
         self._window.addstr(
             Position(viewport.y + viewport.height - 1, viewport.x),
-            "└" + "─" * (viewport.width - 2) + "┘",
+            "└" + "─" * inner_width + "┘",
             color=border_color,
         )
 
@@ -196,14 +213,11 @@ class ColumnManagementMode:
 
     def _draw_buttons(self, y: int, width: int) -> None:
         """Draw the OK, Cancel, Reset buttons"""
-        button_width = 10
-        total_width = len(ButtonActions) * button_width + (len(ButtonActions) - 1) * 2
-        start_x = (width - total_width) // 2
+        start_x = (width - _BUTTONS_TOTAL_WIDTH) // 2
 
-        for i, button in enumerate(ButtonActions):
-            x = start_x + i * (button_width + 2)
+        for button, button_text, x_offset in _BUTTON_LAYOUT:
             is_selected = self._view_model.is_button_selected(button)
-
             color = Color.SELECTED if is_selected else Color.DEFAULT
-            button_text = f"[{button.value:^8}]"
-            self._window.addstr(Position(y, x), button_text, color=color)
+            self._window.addstr(
+                Position(y, start_x + x_offset), button_text, color=color
+            )
@@ -21,8 +21,18 @@ class DetailsMode:
         entries_win: Window,
     ) -> None:
         self._entries_win = entries_win
-        self._last_entry_id: str | None = None
-        self._last_window_size: tuple[int, int] | None = None
+        # What the last frame showed, to skip redrawing an unchanged view
+        self._last_drawn: tuple | None = None
+        # Wrapped lines of the last value broken, as (value, width, lines)
+        self._wrap_cache: tuple[str, int, list[str]] = ("", 0, [])
+        # Wrapped lines of the last instructions drawn, as (text, width, lines)
+        self._instructions_cache: tuple[str, int, list[str]] = ("", 0, [])
+        # Longest key and value of the last fields drawn, as (fields, key, value)
+        self._widths_cache: tuple[list[tuple[str, str]] | None, int, int] = (
+            None,
+            0,
+            0,
+        )
 
         # Create viewmodel to handle business logic
         self.viewmodel = DetailsViewModel(state)
@@ -52,19 +62,36 @@ class DetailsMode:
         if not entry:
             return
 
-        self._entries_win.clear()
-        self._entries_win.noutrefresh()
         size = self._entries_win.getmaxyx()
+        if self._get_drawn_view(entry, size) == self._last_drawn:
+            return
+
+        # Only the first frame repaints the whole screen, later ones are diffed,
+        # as moving between fields changes just part of the view
+        if self._last_drawn is None:
+            self._entries_win.clear()
+        else:
+            self._entries_win.erase()
 
         if self.viewmodel.in_fullscreen_mode:
             self._draw_fullscreen_field(entry, size)
         else:
             self._draw_normal_view(entry, size)
 
-        self._entries_win.refresh()
-
-        self._last_entry_id = f"{entry.line_number}:{hash(entry.raw_line)}"
-        self._last_window_size = (size.height, size.width)
+        self._entries_win.noutrefresh()
+        # Drawing may have scrolled to keep the current field visible
+        self._last_drawn = self._get_drawn_view(entry, size)
+
+    def _get_drawn_view(self, entry: LogEntry, size: Size) -> tuple:
+        """Everything that decides what a frame of the details view shows"""
+        return (
+            entry,
+            self.viewmodel.current_field,
+            self.viewmodel.scroll_offset,
+            self.viewmodel.field_content_scroll_offset,
+            self.viewmodel.in_fullscreen_mode,
+            size,
+        )
 
     def _draw_title(self, entry: LogEntry, width: int):
         title = f"Details - Line {entry.line_number}"
@@ -87,17 +114,15 @@ class DetailsMode:
 
     def enter_mode(self) -> None:
         """Called when entering details mode"""
+        self._last_drawn = None
         self.viewmodel.enter_mode()
 
-    def _draw_fields(
-        self, field_indexes: list[int], fields: list[tuple[str, str]]
-    ) -> None:
+    def _draw_fields(self, field_indexes: range, fields: list[tuple[str, str]]) -> None:
 
         size = self._entries_win.getmaxyx()
         content_end_line = size.height - self._CONTENT_START_LINE
         y_pos = self._CONTENT_START_LINE
-        max_key_width = max(len(key) for key, _ in fields) + 3 if fields else 0
-        max_value_width = max(len(value) for _, value in fields) if fields else 0
+        max_key_width, max_value_width = self._get_field_widths(fields)
         if max_key_width + max_value_width > size.width:
             max_key_width = max(size.width - max_value_width, 20)
 
@@ -121,6 +146,18 @@ class DetailsMode:
                 is_selected,
             )
 
+    def _get_field_widths(self, fields: list[tuple[str, str]]) -> tuple[int, int]:
+        """Get the key column and longest value widths, reusing the last result
+
+        The viewmodel returns the same fields list while the entry is unchanged.
+        """
+        cached_fields, key_width, value_width = self._widths_cache
+        if fields is not cached_fields:
+            key_width = max((len(key) + 3 for key, _ in fields), default=0)
+            value_width = max((len(value) for _, value in fields), default=0)
+            self._widths_cache = (fields, key_width, value_width)
+        return key_width, value_width
+
     def _draw_field_value(
         self,
         value: str,
@@ -145,8 +182,9 @@ class DetailsMode:
             return len(visible_lines)
 
         value_str = value.replace("\n", "\\n").replace("\r", "\\r")
-        if value_str:
-            value_str = textwrap.wrap(value_str, available_size.width, max_lines=1)[0]
+        if not self._fits_unwrapped(value_str, available_size.width):
+            wrapped = textwrap.wrap(value_str, available_size.width, max_lines=1)
+            value_str = wrapped[0] if wrapped else ""
 
         self._entries_win.addstr(Position(*start_yx), value_str, color=value_color)
         return 1
@@ -187,9 +225,8 @@ class DetailsMode:
         scroll_offset = self.viewmodel.scroll_offset
         end_field_idx = min(len(fields), scroll_offset + available_height)
 
-        field_indexes = list(range(scroll_offset, end_field_idx))
-        if field_indexes:
-            self._draw_fields(field_indexes, fields)
+        if scroll_offset < end_field_idx:
+            self._draw_fields(range(scroll_offset, end_field_idx), fields)
 
         self._draw_instructions(fields, size)
 
@@ -232,7 +269,10 @@ class DetailsMode:
         self._draw_instructions_lines(instructions, size)
 
     def _draw_instructions_lines(self, instructions: str, size: Size):
-        text_lines = textwrap.wrap(instructions, size.width - 2, max_lines=2)
+        cached_text, cached_width, text_lines = self._instructions_cache
+        if instructions != cached_text or size.width != cached_width:
+            text_lines = textwrap.wrap(instructions, size.width - 2, max_lines=2)
+            self._instructions_cache = (instructions, size.width, text_lines)
         self._entries_win.addstr(
             Position(size.height - 2, 1), text_lines[0], color=Color.INFO
         )
@@ -294,8 +334,28 @@ class DetailsMode:
         return all_lines
 
     @staticmethod
-    def _break_value_into_lines(value: str, available_width: int) -> list[str]:
-        """Break value into all lines without truncation"""
+    def _fits_unwrapped(value: str, available_width: int) -> bool:
+        """Check whether textwrap would return the value unchanged"""
+        return (
+            len(value) <= available_width
+            and value == value.strip()
+            and "\t" not in value
+            and "\v" not in value
+            and "\f" not in value
+        )
+
+    def _break_value_into_lines(self, value: str, available_width: int) -> list[str]:
+        """Break value into all lines without truncation, reusing the last result"""
+        cached_value, cached_width, cached_lines = self._wrap_cache
+        if available_width == cached_width and value == cached_value:
+            return cached_lines
+        lines = self._wrap_value_lines(value, available_width)
+        self._wrap_cache = (value, available_width, lines)
+        return lines
+
+    @staticmethod
+    def _wrap_value_lines(value: str, available_width: int) -> list[str]:
+        """Wrap each line of the value to the available width"""
         value_lines = value.split("\n")
         lines: list[str] = []
         for line in value_lines:
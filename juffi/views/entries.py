@@ -19,12 +19,20 @@ COLOR_LEVEL_MAP: dict[str, Color] = {
     "DEBUG": Color.DEBUG,
     "TRACE": Color.DEBUG,
 }
+# The usual spellings of each level, so most rows skip the .upper() call
+_LEVEL_COLORS: dict[str, Color] = {
+    spelling: color
+    for level, color in COLOR_LEVEL_MAP.items()
+    for spelling in (level, level.lower(), level.capitalize())
+}
 
 
 class EntriesWindow:  # pylint: disable=too-many-instance-attributes
     """Handles the entries display window with columns, scrolling, and navigation"""
 
     _HEADER_HEIGHT = 2
+    # Changes that leave every row except the old and new selection untouched
+    _SELECTION_ONLY_CHANGES = frozenset({"current_row", "follow_mode"})
 
     def __init__(
         self,
@@ -40,13 +48,11 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
         self._entries_win = entries_win
         size = entries_win.getmaxyx()
         self._header_win: Window = self._entries_win.derwin(
-            Viewport(Position(0, 0), Size(self._HEADER_HEIGHT, size.width))
+            Viewport(0, 0, self._HEADER_HEIGHT, size.width)
         )
 
         self._data_win: Window = self._entries_win.derwin(
-            Viewport(
-                Position(self._HEADER_HEIGHT, 0), Size(self._data_height, size.width)
-            )
+            Viewport(self._HEADER_HEIGHT, 0, self._data_height, size.width)
         )
         self._entries_model.set_visible_rows(self._data_height)
 
@@ -102,9 +108,16 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
 
     def draw(self) -> None:
         """Main drawing method with optimized redrawing"""
-        self._draw_column_headers_to_window()
+        if (
+            self._last_current_row is not None
+            and self._state.current_row is not None
+            and self._can_use_efficient_selection_update()
+        ):
+            self._update_selection_rows(self._last_current_row, self._state.current_row)
+        else:
+            self._draw_column_headers_to_window()
+            self._draw_entries_to_window()
 
-        self._draw_entries_to_window()
         self._last_scroll_row = self._entries_model.scroll_row
 
         self._last_current_row = self._state.current_row
@@ -115,45 +128,48 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
 
         size = self._header_win.getmaxyx()
 
+        # Only the sort column is underlined, so the rest of the row is one write
+        cells = []
+        sort_cell: tuple[int, str] | None = None
         x_pos = 1
         for col in self._iter_cols_from_current():
             visible_width = min(col.width, size.width - x_pos - 1)
             header_text = col.name[:visible_width].ljust(visible_width)
 
-            attributes = None
             if col.name == self._state.sort_column:
                 header_text = header_text[:-2] + (
                     " ↓" if self._state.sort_reverse else " ↑"
                 )
-                attributes = [TextAttribute.UNDERLINE]
+                sort_cell = (x_pos, header_text)
 
-            self._header_win.addstr(
-                Position(0, x_pos),
-                header_text,
-                color=Color.HEADER,
-                attributes=attributes,
-            )
+            cells.append(header_text)
             x_pos += visible_width + 1
             if x_pos >= size.width:
                 break
 
+        self._header_win.addstr(Position(0, 1), " ".join(cells), color=Color.HEADER)
+        if sort_cell is not None:
+            self._header_win.addstr(
+                Position(0, sort_cell[0]),
+                sort_cell[1],
+                color=Color.HEADER,
+                attributes=[TextAttribute.UNDERLINE],
+            )
+
         separator_width = min(size.width - 2, x_pos - 1)
         self._header_win.addstr(
             Position(1, 1), "─" * separator_width, color=Color.HEADER
         )
-        self._header_win.refresh()
+        self._header_win.noutrefresh()
 
     def _can_use_efficient_scroll(self) -> bool:
         scroll_diff = self._entries_model.scroll_row - self._last_scroll_row
         return abs(scroll_diff) == 1
 
     def _can_use_efficient_selection_update(self) -> bool:
-        if self._entries_model.scroll_row != self._last_scroll_row:
+        if not self._state.changes <= self._SELECTION_ONLY_CHANGES:
             return False
-        if self._last_current_row is None or self._state.current_row is None:
-            return False
-        row_diff = abs(self._state.current_row - self._last_current_row)
-        return row_diff == 1
+        return self._entries_model.scroll_row == self._last_scroll_row
 
     def _draw_entries_with_scroll(self) -> None:
         scroll_diff = self._entries_model.scroll_row - self._last_scroll_row
@@ -163,17 +179,18 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
         elif scroll_diff == 1:
             self._scroll_down_one_line()
 
-        self._data_win.refresh()
+        self._data_win.noutrefresh()
 
         self._last_scroll_row = self._entries_model.scroll_row
 
     def _scroll_up_one_line(self) -> None:
         self._data_win.scroll_up(0)
+        columns = list(self._iter_cols_from_current())
 
         entry_idx = self._entries_model.scroll_row
         if 0 <= entry_idx < len(self._state.filtered_entries):
             entry = self._state.filtered_entries[entry_idx]
-            self._draw_single_entry_to_window(0, entry_idx, entry)
+            self._draw_single_entry_to_window(0, entry_idx, entry, columns)
 
         if self._state.current_row is None:
             return
@@ -194,17 +211,20 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
 
         win_row = old_selected_idx - scroll_row
         entry = self._state.filtered_entries[old_selected_idx]
-        self._draw_single_entry_to_window(win_row, old_selected_idx, entry)
+        self._draw_single_entry_to_window(win_row, old_selected_idx, entry, columns)
 
     def _scroll_down_one_line(self) -> None:
         self._data_win.scroll_down(0)
+        columns = list(self._iter_cols_from_current())
 
         size = self._data_win.getmaxyx()
         entry_idx = self._entries_model.scroll_row + size.height - 1
 
         if 0 <= entry_idx < len(self._state.filtered_entries):
             entry = self._state.filtered_entries[entry_idx]
-            self._draw_single_entry_to_window(size.height - 1, entry_idx, entry)
+            self._draw_single_entry_to_window(
+                size.height - 1, entry_idx, entry, columns
+            )
 
         if self._state.current_row is None:
             return
@@ -224,7 +244,7 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
 
         win_row = old_selected_idx - scroll_row
         entry = self._state.filtered_entries[old_selected_idx]
-        self._draw_single_entry_to_window(win_row, old_selected_idx, entry)
+        self._draw_single_entry_to_window(win_row, old_selected_idx, entry, columns)
 
     def _draw_entries_to_window(self) -> None:
         """Draw visible entries directly to the window"""
@@ -234,54 +254,64 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
 
         start_entry = self._entries_model.scroll_row
         end_entry = min(start_entry + size.height, len(self._state.filtered_entries))
+        columns = list(self._iter_cols_from_current())
 
         for win_row, entry_idx in enumerate(range(start_entry, end_entry)):
             entry = self._state.filtered_entries[entry_idx]
-            self._draw_single_entry_to_window(win_row, entry_idx, entry)
+            self._draw_single_entry_to_window(win_row, entry_idx, entry, columns)
 
-        self._data_win.refresh()
+        self._data_win.noutrefresh()
 
     def _draw_single_entry_to_window(
-        self, win_row: int, entry_idx: int, entry: LogEntry
+        self, win_row: int, entry_idx: int, entry: LogEntry, columns: list[Column]
     ) -> None:
-        """Draw a single entry to the window at the specified window row"""
+        """Draw a single entry to the window at the specified window row
+
+        Args:
+            columns: The columns to draw, starting from the current column
+        """
         is_selected = entry_idx == self._state.current_row
         size = self._data_win.getmaxyx()
 
+        color = Color.DEFAULT
+        if is_selected:
+            color = Color.SELECTED
+        elif entry.level:
+            level_color = self._get_color_for_level(entry.level)
+            if level_color:
+                color = level_color
+
+        # All cells in a row share a color, so the row is written in a single call
+        cells = []
         x_pos = 1
-        for col in self._iter_cols_from_current():
+        for col in columns:
             value = (
                 entry.get_value(col.name)[: col.width]
                 .ljust(col.width)
                 .replace("\n", "\\n")
             )
 
-            color = Color.DEFAULT
-            if is_selected:
-                color = Color.SELECTED
-            elif entry.level:
-                level_color = self._get_color_for_level(entry.level.upper())
-                if level_color:
-                    color = level_color
-
             visible_width = min(size.width - x_pos - 1, col.width)
-            visible_value = value[:visible_width]
-            self._data_win.addstr(Position(win_row, x_pos), visible_value, color=color)
+            cells.append(value[:visible_width])
 
             x_pos += col.width + 1
             if x_pos >= size.width:
                 break
 
+        self._data_win.addstr(Position(win_row, 1), " ".join(cells), color=color)
+
     @staticmethod
     def _get_color_for_level(level: str) -> Color | None:
-        if level in COLOR_LEVEL_MAP:
-            return COLOR_LEVEL_MAP[level]
-        return None
+        color = _LEVEL_COLORS.get(level)
+        if color is None:
+            color = COLOR_LEVEL_MAP.get(level.upper())
+        return color
 
     def _update_selection_rows(self, old_row: int, new_row: int) -> None:
         """Update only the rows that changed selection status"""
         size = self._data_win.getmaxyx()
         scroll_row = self._entries_model.scroll_row
+        columns = list(self._iter_cols_from_current())
 
         if (
             0 <= old_row < len(self._state.filtered_entries)
@@ -289,7 +319,7 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
         ):
             win_row = old_row - scroll_row
             self._draw_single_entry_to_window(
-                win_row, old_row, self._state.filtered_entries[old_row]
+                win_row, old_row, self._state.filtered_entries[old_row], columns
             )
 
         if (
@@ -298,18 +328,17 @@ class EntriesWindow:  # pylint: disable=too-many-instance-attributes
         ):
             win_row = new_row - scroll_row
             self._draw_single_entry_to_window(
-                win_row, new_row, self._state.filtered_entries[new_row]
+                win_row, new_row, self._state.filtered_entries[new_row], columns
             )
 
-        self._data_win.refresh()
+        self._data_win.noutrefresh()
 
     @property
     def _scroll_x(self) -> int:
-        scroll_x = 0
-        for i in range(self._state.columns.index(self._state.current_column)):
-            if i < len(self._state.columns):
-                scroll_x += next(islice(self._state.columns.values(), i, None)).width
-        return scroll_x
+        current_index = self._state.columns.index(self._state.current_column)
+        return sum(
+            col.width for col in islice(self._state.columns.values(), current_index)
+        )
 
     def move_column(self, to_the_right: bool) -> None:
         """Move column left or right"""
@@ -2,10 +2,63 @@
 
 import curses
 
-from juffi.helpers.curses_utils import Color, Position
+from juffi.helpers.curses_utils import Color, Position, Size
 from juffi.models.juffi_model import JuffiState
 from juffi.output_controller import Window
 
+_HELP_TEXT = (
+    "JSON LOG VIEWER - HELP",
+    "",
+    "Use ↑/↓ to scroll",
+    "",
+    "Navigation:",
+    "  ↑         - Move up",
+    "  ↓         - Move down",
+    "  PgUp      - Page up",
+    "  PgDn      - Page down",
+    "  Home      - Go to top",
+    "  End       - Go to bottom",
+    "  g         - Go to specific row",
+    "",
+    "Column Operations:",
+    "  ←/→       - Scroll columns left/right",
+    "  s         - Sort by current column",
+    "  S         - Reverse sort by current column",
+    "  </>       - Move column left/right",
+    "  w/W       - Decrease/increase column width",
+    "  m         - Column management screen",
+    "",
+    "Filtering & Search:",
+    "  /         - Search all fields",
+    "  f         - Filter by column",
+    "  c         - Clear all filters",
+    "  n/N       - Next/previous search result",
+    "",
+    "View Options:",
+    "  d         - Toggle details view for current entry",
+    "",
+    "Details Mode Navigation:",
+    "  ↑/↓       - Navigate between fields",
+    "  ←/→       - Navigate between entries",
+    "  Enter     - Toggle fullscreen view of current field",
+    "",
+    "Fullscreen Mode (in Details):",
+    "  ↑/↓       - Scroll by line",
+    "  PgUp/PgDn - Scroll by page",
+    "  Enter/Esc - Exit fullscreen",
+    "",
+    "File Operations:",
+    "  F         - Toggle follow mode",
+    "  r         - Refresh/reload",
+    "  R         - Reset view (clear filters, sort)",
+    "",
+    "Other:",
+    "  h/?       - Toggle this help",
+    "  q/Esc     - Quit",
+    "",
+    "Press any key to continue...",
+)
+
 
 class HelpMode:
     """Handles help mode input and drawing logic"""
@@ -13,10 +66,12 @@ class HelpMode:
     def __init__(self, state: JuffiState) -> None:
         self._state = state
         self._scroll_offset = 0
+        self._last_drawn: tuple[int, Size] | None = None
 
     def enter_mode(self) -> None:
         """Called when entering help mode"""
         self._scroll_offset = 0
+        self._last_drawn = None
 
     def handle_input(self, key: int) -> None:
         """Handle input for help mode. Returns True if key was handled."""
@@ -27,74 +82,27 @@ class HelpMode:
 
     def draw(self, stdscr: Window) -> None:
         """Draw help screen"""
-        height, width = self._state.terminal_size
-
-        help_text = [
-            "JSON LOG VIEWER - HELP",
-            "",
-            "Use ↑/↓ to scroll",
-            "",
-            "Navigation:",
-            "  ↑         - Move up",
-            "  ↓         - Move down",
-            "  PgUp      - Page up",
-            "  PgDn      - Page down",
-            "  Home      - Go to top",
-            "  End       - Go to bottom",
-            "  g         - Go to specific row",
-            "",
-            "Column Operations:",
-            "  ←/→       - Scroll columns left/right",
-            "  s         - Sort by current column",
-            "  S         - Reverse sort by current column",
-            "  </>       - Move column left/right",
-            "  w/W       - Decrease/increase column width",
-            "  m         - Column management screen",
-            "",
-            "Filtering & Search:",
-            "  /         - Search all fields",
-            "  f         - Filter by column",
-            "  c         - Clear all filters",
-            "  n/N       - Next/previous search result",
-            "",
-            "View Options:",
-            "  d         - Toggle details view for current entry",
-            "",
-            "Details Mode Navigation:",
-            "  ↑/↓       - Navigate between fields",
-            "  ←/→       - Navigate between entries",
-            "  Enter     - Toggle fullscreen view of current field",
-            "",
-            "Fullscreen Mode (in Details):",
-            "  ↑/↓       - Scroll by line",
-            "  PgUp/PgDn - Scroll by page",
-            "  Enter/Esc - Exit fullscreen",
-            "",
-            "File Operations:",
-            "  F         - Toggle follow mode",
-            "  r         - Refresh/reload",
-            "  R         - Reset view (clear filters, sort)",
-            "",
-            "Other:",
-            "  h/?       - Toggle this help",
-            "  q/Esc     - Quit",
-            "",
-            "Press any key to continue...",
-        ]
+        terminal_size = self._state.terminal_size
+        height, width = terminal_size
 
-        max_scroll = max(0, len(help_text) - height)
+        max_scroll = max(0, len(_HELP_TEXT) - height)
         self._scroll_offset = max(0, min(self._scroll_offset, max_scroll))
 
-        stdscr.clear()
+        # The help text is static, so only scrolling or resizing changes it
+        drawn = (self._scroll_offset, terminal_size)
+        if drawn == self._last_drawn:
+            return
+        if self._last_drawn is None:
+            stdscr.clear()
+        else:
+            stdscr.erase()
+        self._last_drawn = drawn
 
         x_pos = max(0, width // 4)
-        visible_lines = min(height, len(help_text) - self._scroll_offset)
+        visible_lines = _HELP_TEXT[self._scroll_offset : self._scroll_offset + height]
 
-        for i in range(visible_lines):
-            text_index = self._scroll_offset + i
-            if text_index < len(help_text):
-                line = help_text[text_index]
-                color = Color.HEADER if text_index == 0 else Color.DEFAULT
-                stdscr.addstr(Position(i, x_pos), line, color=color)
+        for i, line in enumerate(visible_lines):
+            color = Color.HEADER if self._scroll_offset + i == 0 else Color.DEFAULT
+            stdscr.addstr(Position(i, x_pos), line, color=color)
 
-        stdscr.refresh()
+        stdscr.noutrefresh()
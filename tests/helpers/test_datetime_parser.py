@@ -0,0 +1,47 @@
+"""Tests for the datetime parsing helpers."""
+
+from datetime import datetime
+
+import pytest
+
+from juffi.helpers.datetime_parser import try_parse_datetime
+
+
+@pytest.mark.parametrize(
+    "ts_str, expected",
+    [
+        ("2023-01-15T10:30:45.123Z", datetime(2023, 1, 15, 10, 30, 45, 123000)),
+        ("2023-01-15T10:30:45.123456", datetime(2023, 1, 15, 10, 30, 45, 123456)),
+        ("2023-01-15T10:30:45.1", datetime(2023, 1, 15, 10, 30, 45, 100000)),
+        ("2023-01-15 10:30:45", datetime(2023, 1, 15, 10, 30, 45)),
+        ("2023-01-15T10:30:45Z", datetime(2023, 1, 15, 10, 30, 45)),
+        ("2023-1-5T1:3:4", datetime(2023, 1, 5, 1, 3, 4)),
+    ],
+)
+def test_try_parse_datetime_supported_formats(ts_str: str, expected: datetime) -> None:
+    """Test that the supported formats parse to the expected datetime."""
+    # Act
+    result = try_parse_datetime(ts_str)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "ts_str",
+    [
+        "not a timestamp",
+        "2023-02-30T10:00:00",
+        "2023-01-15 10:30:45.123",
+        "2023-01-15T10:30:45.1234567",
+        "2023-01-15T10:30:45+00:00",
+        "2023-01-15T10:30:4x",
+    ],
+)
+def test_try_parse_datetime_unsupported_values(ts_str: str) -> None:
+    """Test that invalid or unsupported strings are not parsed."""
+    # Act
+    result = try_parse_datetime(ts_str)
+
+    # Assert
+    assert result is None
@@ -0,0 +1,29 @@
+"""Tests for the dev_utils module"""
+
+import logging
+
+import pytest
+
+from juffi.helpers.dev_utils import measure
+
+logger = logging.getLogger(__name__)
+
+
+def test_measure_formats_name_with_args(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that measure formats the name with its args in the logged message"""
+    # Act
+    with caplog.at_level(logging.INFO), measure(logger, "handle_input on key %d", 5):
+        pass
+
+    # Assert
+    assert caplog.messages[0].startswith("handle_input on key 5 took ")
+
+
+def test_measure_logs_name_with_percent_sign(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a % in a name without args is logged as is"""
+    # Act
+    with caplog.at_level(logging.INFO), measure(logger, "load 100% of the file"):
+        pass
+
+    # Assert
+    assert caplog.messages[0].startswith("load 100% of the file took ")
@@ -0,0 +1,87 @@
+"""Tests for the IndexedDict helper."""
+
+import pytest
+
+from juffi.helpers.indexed_dict import IndexedDict
+
+
+def test_getitem_by_int_and_index_by_key() -> None:
+    """Test that values and positions can be looked up in both directions."""
+    # Arrange
+    indexed = IndexedDict[int]([("a", 1), ("b", 2), ("c", 3)])
+
+    # Act & Assert
+    assert indexed[1] == 2
+    assert indexed[-1] == 3
+    assert indexed.index("c") == 2
+
+
+def test_index_of_missing_key_raises_key_error() -> None:
+    """Test that index raises KeyError for a missing key."""
+    # Arrange
+    indexed = IndexedDict[int]([("a", 1)])
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        indexed.index("missing")
+
+
+def test_positions_follow_insertions_and_deletions() -> None:
+    """Test that positional lookups reflect mutations after earlier lookups."""
+    # Arrange
+    indexed = IndexedDict[int]([("a", 1), ("b", 2), ("c", 3)])
+    assert indexed[0] == 1
+    assert indexed.index("c") == 2
+
+    # Act
+    indexed.pop("a")
+    indexed["d"] = 4
+
+    # Assert
+    assert indexed[0] == 2
+    assert indexed[-1] == 4
+    assert indexed.index("c") == 1
+    assert indexed.index("d") == 2
+
+
+def test_positions_follow_reordering() -> None:
+    """Test that positional lookups reflect move_to_end and popitem."""
+    # Arrange
+    indexed = IndexedDict[int]([("a", 1), ("b", 2), ("c", 3)])
+    assert indexed.index("a") == 0
+
+    # Act
+    indexed.move_to_end("a")
+    indexed.popitem(last=False)
+
+    # Assert
+    assert indexed[0] == 3
+    assert indexed.index("a") == 1
+
+
+def test_value_replacement_is_visible_by_position() -> None:
+    """Test that replacing a value updates positional access."""
+    # Arrange
+    indexed = IndexedDict[int]([("a", 1), ("b", 2)])
+    assert indexed[1] == 2
+
+    # Act
+    indexed["b"] = 20
+
+    # Assert
+    assert indexed[1] == 20
+
+
+def test_move_reorders_items() -> None:
+    """Test that move places the item at the target position."""
+    # Arrange
+    indexed = IndexedDict[int]([("a", 1), ("b", 2), ("c", 3), ("d", 4)])
+    assert indexed.index("d") == 3
+
+    # Act
+    indexed.move(3, 1)
+
+    # Assert
+    assert list(indexed.keys()) == ["a", "d", "b", "c"]
+    assert indexed.index("d") == 1
+    assert indexed[3] == 3
@@ -0,0 +1,57 @@
+"""Tests for the list utility functions."""
+
+from juffi.helpers.list_utils import find_first, find_first_index
+
+
+def test_find_first_index_returns_first_match() -> None:
+    """Test that find_first_index returns the index of the first match."""
+    # Arrange
+    items = [1, 4, 6, 8]
+
+    # Act
+    result = find_first_index(items, lambda x: x % 2 == 0)
+
+    # Assert
+    assert result == 1
+
+
+def test_find_first_index_returns_default_when_no_match() -> None:
+    """Test that find_first_index returns the default when nothing matches."""
+    # Arrange
+    items = [1, 3, 5]
+
+    # Act
+    result = find_first_index(items, lambda x: x % 2 == 0, default=-1)
+
+    # Assert
+    assert result == -1
+
+
+def test_find_first_index_returns_none_without_default() -> None:
+    """Test that find_first_index returns None when nothing matches."""
+    # Act
+    result = find_first_index([], lambda x: True)
+
+    # Assert
+    assert result is None
+
+
+def test_find_first_returns_first_matching_item() -> None:
+    """Test that find_first returns the first matching item."""
+    # Arrange
+    items = ["apple", "banana", "blueberry"]
+
+    # Act
+    result = find_first(items, lambda x: x.startswith("b"))
+
+    # Assert
+    assert result == "banana"
+
+
+def test_find_first_returns_none_when_no_match() -> None:
+    """Test that find_first returns None when nothing matches."""
+    # Act
+    result = find_first(iter(["apple"]), lambda x: x.startswith("z"))
+
+    # Assert
+    assert result is None
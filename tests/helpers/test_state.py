@@ -206,3 +206,32 @@ def test_state_clear_changes() -> None:
 
     # Assert
     assert len(state.changes) == 0
+
+
+def test_field_reassigning_same_object_skips_comparison() -> None:
+    """Test that reassigning the same object is not compared or tracked."""
+
+    # Arrange
+    class Uncomparable:  # pylint: disable=too-few-public-methods
+        """Value whose comparison must not be reached."""
+
+        def __eq__(self, other: object) -> bool:
+            raise AssertionError("compared")
+
+        __hash__ = object.__hash__
+
+    class TestState(State):
+        """Test state class."""
+
+        items = Field[list[Uncomparable]](list)
+
+    state = TestState()
+    items = [Uncomparable()]
+    state.items = items
+    state.clear_changes()
+
+    # Act
+    state.items = items
+
+    # Assert
+    assert len(state.changes) == 0
@@ -0,0 +1,45 @@
+"""Mock input controller for testing"""
+
+from typing import Iterator
+
+from juffi.input_controller import InputController
+
+
+class MockInputController(InputController):
+    """Mock input controller for testing"""
+
+    def __init__(
+        self, data_lines: list[str] | None = None, input_name: str = "test.log"
+    ):
+        self.data_lines = data_lines or []
+        self.input_keys: list[int] = []
+        self.input_index: int = 0
+        self.input_name = input_name
+        self.last_read_index: int = 0
+
+    @property
+    def name(self) -> str:
+        return self.input_name
+
+    def get_input(self) -> int:
+        if self.input_index < len(self.input_keys):
+            key = self.input_keys[self.input_index]
+            self.input_index += 1
+            return key
+        return -1
+
+    def get_data(self) -> Iterator[str]:
+        new_lines = self.data_lines[self.last_read_index :]
+        self.last_read_index = len(self.data_lines)
+        return iter(new_lines)
+
+    def add_data(self, new_lines: list[str]) -> None:
+        """Add new data to the same data list"""
+        self.data_lines.extend(new_lines)
+
+    def reset(self) -> None:
+        """Reset the read index to the beginning"""
+        self.last_read_index = 0
+
+    def timeout(self, delay: int) -> None:
+        """Set blocking or non-blocking read"""
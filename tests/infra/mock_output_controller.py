@@ -34,30 +34,32 @@ class MockWindow(Window):
 
     def derwin(self, viewport: Viewport) -> Window:
         absolute_viewport = Viewport(
-            Position(
-                self._viewport.pos.y + viewport.pos.y,
-                self._viewport.pos.x + viewport.pos.x,
-            ),
-            viewport.size,
+            self._viewport.y + viewport.y,
+            self._viewport.x + viewport.x,
+            viewport.height,
+            viewport.width,
         )
         derived = MockWindow(self._content, absolute_viewport, self._cursor_position)
         return derived
 
     def resize(self, size: Size) -> None:
-        self._viewport = Viewport(self._viewport.pos, size)
+        self._viewport = self._viewport._replace(height=size.height, width=size.width)
 
     def mvderwin(self, position: Position) -> None:
-        self._viewport = Viewport(position, self._viewport.size)
+        self._viewport = self._viewport._replace(y=position.y, x=position.x)
 
     def getmaxyx(self) -> Size:
-        return self._viewport.size
+        return Size(self._viewport.height, self._viewport.width)
 
     def clear(self) -> None:
         for y in range(self._viewport.height):
             for x in range(self._viewport.width):
-                abs_pos = Position(self._viewport.pos.y + y, self._viewport.pos.x + x)
+                abs_pos = Position(self._viewport.y + y, self._viewport.x + x)
                 self._content.pop(abs_pos, None)
 
+    def erase(self) -> None:
+        self.clear()
+
     def refresh(self) -> None:
         pass
 
@@ -79,8 +81,8 @@ class MockWindow(Window):
                 and local_pos.y < self._viewport.height
             ):
                 abs_pos = Position(
-                    self._viewport.pos.y + local_pos.y,
-                    self._viewport.pos.x + local_pos.x,
+                    self._viewport.y + local_pos.y,
+                    self._viewport.x + local_pos.x,
                 )
                 self._content[abs_pos] = CharCell(char, color, attributes)
 
@@ -89,7 +91,7 @@ class MockWindow(Window):
         result = {}
         for y in range(self._viewport.height):
             for x in range(self._viewport.width):
-                abs_pos = Position(self._viewport.pos.y + y, self._viewport.pos.x + x)
+                abs_pos = Position(self._viewport.y + y, self._viewport.x + x)
                 if abs_pos in self._content:
                     local_pos = Position(y, x)
                     result[local_pos] = self._content[abs_pos]
@@ -97,9 +99,7 @@ class MockWindow(Window):
 
     def get_text_at(self, position: Position) -> str | None:
         """Get the text at a specific position (relative to this window)"""
-        abs_pos = Position(
-            self._viewport.pos.y + position.y, self._viewport.pos.x + position.x
-        )
+        abs_pos = Position(self._viewport.y + position.y, self._viewport.x + position.x)
         if abs_pos in self._content:
             return self._content[abs_pos].char
         return None
@@ -108,7 +108,7 @@ class MockWindow(Window):
         """Get the text content of a line (relative to this window)"""
         line_chars = []
         for x in range(self._viewport.width):
-            abs_pos = Position(self._viewport.pos.y + y, self._viewport.pos.x + x)
+            abs_pos = Position(self._viewport.y + y, self._viewport.x + x)
             if abs_pos in self._content:
                 line_chars.append(self._content[abs_pos].char)
             else:
@@ -120,19 +120,15 @@ class MockWindow(Window):
         return [self.get_line(y) for y in range(self._viewport.height)]
 
     def move(self, position: Position) -> None:
-        abs_pos = Position(
-            self._viewport.pos.y + position.y, self._viewport.pos.x + position.x
-        )
+        abs_pos = Position(self._viewport.y + position.y, self._viewport.x + position.x)
         self._cursor_position[0] = abs_pos
 
     def scroll_up(self, line: int) -> None:
         """Insert a blank line at the given line number, shifting content down"""
         for y in range(self._viewport.height - 1, line, -1):
             for x in range(self._viewport.width):
-                src_pos = Position(
-                    self._viewport.pos.y + y - 1, self._viewport.pos.x + x
-                )
-                dst_pos = Position(self._viewport.pos.y + y, self._viewport.pos.x + x)
+                src_pos = Position(self._viewport.y + y - 1, self._viewport.x + x)
+                dst_pos = Position(self._viewport.y + y, self._viewport.x + x)
 
                 if src_pos in self._content:
                     self._content[dst_pos] = self._content[src_pos]
@@ -140,17 +136,15 @@ class MockWindow(Window):
                     self._content.pop(dst_pos, None)
 
         for x in range(self._viewport.width):
-            clear_pos = Position(self._viewport.pos.y + line, self._viewport.pos.x + x)
+            clear_pos = Position(self._viewport.y + line, self._viewport.x + x)
             self._content.pop(clear_pos, None)
 
     def scroll_down(self, line: int) -> None:
         """Delete line at the given line number, shifting content up"""
         for y in range(line, self._viewport.height - 1):
             for x in range(self._viewport.width):
-                src_pos = Position(
-                    self._viewport.pos.y + y + 1, self._viewport.pos.x + x
-                )
-                dst_pos = Position(self._viewport.pos.y + y, self._viewport.pos.x + x)
+                src_pos = Position(self._viewport.y + y + 1, self._viewport.x + x)
+                dst_pos = Position(self._viewport.y + y, self._viewport.x + x)
 
                 if src_pos in self._content:
                     self._content[dst_pos] = self._content[src_pos]
@@ -158,8 +152,8 @@ class MockWindow(Window):
                     self._content.pop(dst_pos, None)
 
         for x in range(self._viewport.width):
-            clear_y = self._viewport.pos.y + self._viewport.height - 1
-            clear_pos = Position(clear_y, self._viewport.pos.x + x)
+            clear_y = self._viewport.y + self._viewport.height - 1
+            clear_pos = Position(clear_y, self._viewport.x + x)
             self._content.pop(clear_pos, None)
 
 
@@ -179,7 +173,7 @@ class MockOutputController(OutputController):
         self._cursor_position = [Position(0, 0)]
 
     def create_main_window(self) -> Window:
-        viewport = Viewport(Position(0, 0), self._terminal_size)
+        viewport = Viewport(0, 0, *self._terminal_size)
         return MockWindow(self._screen_content, viewport, self._cursor_position)
 
     def get_color_attr(self, color: Color) -> int:
@@ -200,6 +194,9 @@ class MockOutputController(OutputController):
     def get_terminal_size(self) -> Size:
         return self._terminal_size
 
+    def doupdate(self) -> None:
+        pass
+
     def set_terminal_size(self, size: Size) -> None:
         """Set the terminal size for testing"""
         self._terminal_size = size
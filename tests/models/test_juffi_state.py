@@ -1,5 +1,7 @@
 """Tests for JuffiState business logic."""
 
+import json
+
 import pytest
 
 from juffi.helpers.curses_utils import Size
@@ -115,6 +117,21 @@ def test_move_column(state: JuffiState) -> None:
     assert list(state.columns.keys()) == ["#", "message", "service", "level"]
 
 
+def test_move_column_left_reports_change(state: JuffiState) -> None:
+    """Test that moving a column left reorders it in place and reports the change."""
+    # Arrange
+    state.set_columns_from_names(["#", "level", "message", "service"])
+    state.clear_changes()
+
+    # Act
+    state.move_column(3, 1)
+
+    # Assert
+    assert list(state.columns.keys()) == ["#", "service", "level", "message"]
+    assert state.columns[1].name == "service"
+    assert "columns" in state.changes
+
+
 def test_set_column_width(state: JuffiState) -> None:
     """Test that set_column_width updates column width."""
     # Arrange
@@ -276,6 +293,24 @@ def test_column_detection_accumulates_over_time(state: JuffiState) -> None:
     assert "service" in second_discovered
 
 
+def test_column_detection_without_new_columns_reports_no_change(
+    state: JuffiState,
+) -> None:
+    """Test that rediscovering known columns does not notify their watchers."""
+    # Arrange
+    entry1 = LogEntry('{"level": "info"}', 1)
+    entry2 = LogEntry('{"level": "error"}', 2)
+    state.set_filtered_entries([entry1])
+    state.clear_changes()
+
+    # Act
+    state.set_filtered_entries([entry1, entry2], added_entries=[entry2])
+
+    # Assert
+    assert "all_discovered_columns" not in state.changes
+    assert state.all_discovered_columns == {"#", "level"}
+
+
 def test_empty_filtered_entries_includes_line_number_column(state: JuffiState) -> None:
     """Test that empty filtered entries still includes line number column."""
     # Act
@@ -284,3 +319,57 @@ def test_empty_filtered_entries_includes_line_number_column(state: JuffiState) -
     # Assert
     assert "#" in state.all_discovered_columns
     assert "#" in state.columns
+
+
+def test_column_detection_counts_only_added_entries(state: JuffiState) -> None:
+    """Test that passing added entries extends the previous column counts."""
+    # Arrange
+    entry1 = LogEntry('{"field_a": "value", "field_b": "value"}', 1)
+    entry2 = LogEntry('{"field_b": "value", "field_c": "value"}', 2)
+    entry3 = LogEntry('{"field_c": "value"}', 3)
+    state.set_filtered_entries([entry1])
+
+    # Act
+    state.set_filtered_entries([entry1, entry2, entry3], added_entries=[entry2, entry3])
+
+    # Assert
+    incremental_columns = list(state.columns.keys())
+    state.set_filtered_entries([entry1, entry2, entry3])
+    assert incremental_columns == list(state.columns.keys())
+    assert incremental_columns.index("field_b") < incremental_columns.index("field_a")
+
+
+def test_column_detection_orders_tied_columns_by_first_appearance(
+    state: JuffiState,
+) -> None:
+    """Test that tied columns keep the order they first appear in the log."""
+    # Arrange
+    entry1 = LogEntry('{"zeta": "value"}', 1)
+    entry2 = LogEntry('{"alpha": "value"}', 2)
+    state.set_filtered_entries([entry1])
+
+    # Act
+    state.set_filtered_entries([entry2, entry1], added_entries=[entry2])
+
+    # Assert
+    incremental_columns = list(state.columns.keys())
+    state.set_filtered_entries([entry2, entry1])
+    assert incremental_columns == list(state.columns.keys())
+    assert incremental_columns == ["#", "zeta", "alpha"]
+
+
+def test_column_widths_fit_content_up_to_the_cap(state: JuffiState) -> None:
+    """Test that column widths fit their content but never exceed the cap."""
+    # Arrange
+    state.terminal_size = Size(24, 80)
+    entries = [
+        LogEntry(json.dumps({"message": "x" * 200, "level": "info"}), 1),
+        LogEntry(json.dumps({"message": "short", "level": "warning"}), 2),
+    ]
+
+    # Act
+    state.set_filtered_entries(entries)
+
+    # Assert
+    assert state.columns["message"].width == 50
+    assert state.columns["level"].width == len("warning") + 1
@@ -5,9 +5,24 @@ import math
 from datetime import datetime
 from types import NoneType
 
+import pytest
+
+from juffi.models import log_entry
 from juffi.models.log_entry import LogEntry
 
 
+@pytest.fixture(name="json_parser", params=["orjson", "json"])
+def json_parser_fixture(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Parse entries with orjson when installed, or with the json module only."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(log_entry, "_fast_loads", None)
+    return request.param
+
+
 class TestLogEntryInitialization:
     """Test LogEntry initialization and JSON parsing."""
 
@@ -77,6 +92,40 @@ class TestLogEntryInitialization:
         assert entry.data == {"message": malformed_json}
 
 
+@pytest.mark.usefixtures("json_parser")
+class TestLogEntryJsonParsers:
+    """Test that both JSON parsers give the standard json module's results."""
+
+    def test_integer_wider_than_64_bits_is_kept_exact(self) -> None:
+        """Test that big integers, like trace ids, are not turned into floats."""
+        entry = LogEntry('{"trace": 123456789012345678901234567890}', 1)
+
+        assert entry.is_valid_json is True
+        assert entry.data["trace"] == 123456789012345678901234567890
+        assert entry.get_value("trace") == "123456789012345678901234567890"
+
+    def test_nested_integer_wider_than_64_bits_is_kept_exact(self) -> None:
+        """Test that big integers inside nested values are not turned into floats."""
+        entry = LogEntry('{"span": {"ids": [18446744073709551616]}}', 1)
+
+        assert entry.data["span"] == {"ids": [18446744073709551616]}
+
+    def test_nan_and_infinity_values_are_parsed(self) -> None:
+        """Test that NaN and Infinity values still make a JSON entry."""
+        entry = LogEntry('{"ratio": NaN, "limit": Infinity}', 1)
+
+        assert entry.is_valid_json is True
+        assert math.isnan(entry.data["ratio"])
+        assert entry.data["limit"] == math.inf
+
+    def test_lone_surrogate_escape_is_parsed(self) -> None:
+        """Test that a lone surrogate escape still makes a JSON entry."""
+        entry = LogEntry('{"text": "\\ud800"}', 1)
+
+        assert entry.is_valid_json is True
+        assert entry.data["text"] == "\ud800"
+
+
 class TestLogEntryTimestampParsing:
     """Test timestamp parsing functionality."""
 
@@ -333,6 +382,16 @@ class TestLogEntryGetValue:
         parsed = json.loads(result)
         assert parsed == [1, 2, 3, "four"]
 
+    def test_get_value_nested_field_is_serialized_once(self) -> None:
+        """Test that repeated lookups of a nested field reuse the same string."""
+        json_line = '{"metadata": {"key": "value"}, "items": [1, 2]}'
+        entry = LogEntry(json_line, 1)
+
+        first = entry.get_value("metadata")
+
+        assert entry.get_value("metadata") is first
+        assert entry.get_value("items") == "[1, 2]"
+
     def test_get_value_numeric_fields(self) -> None:
         """Test getting value of numeric fields."""
         json_line = '{"count": 42, "price": 19.99}'
@@ -564,7 +623,7 @@ class TestLogEntryMatchesSearch:
 
         assert entry.matches_search("error") is True
         assert entry.matches_search("database") is True
-        assert entry.matches_search("CONNECTION") is True
+        assert entry.matches_search("connection") is True
 
     def test_matches_search_in_raw_line(self) -> None:
         """Test searching in raw line when not found in data values."""
@@ -613,6 +672,15 @@ class TestLogEntryMatchesSearch:
         assert entry.matches_search("admin") is True
         assert entry.matches_search("important") is True
 
+    def test_matches_search_repeated_with_different_terms(self) -> None:
+        """Test that repeated searches on the same entry give independent results."""
+        json_line = '{"message": "Line\\nbreak", "service": "API"}'
+        entry = LogEntry(json_line, 1)
+
+        assert entry.matches_search("line\nbreak") is True
+        assert entry.matches_search("api") is True
+        assert entry.matches_search("breakapi") is False
+
 
 class TestLogEntryEdgeCases:
     """Test edge cases and error conditions."""
@@ -828,12 +896,12 @@ class TestLogEntryIntegration:
         assert entry.get_value("nonexistent") == ""
 
         # Test filtering
-        assert entry.matches_filter({"message": "ERROR"}) is True
+        assert entry.matches_filter({"message": "error"}) is True
         assert entry.matches_filter({"message": "user-auth"}) is True
-        assert entry.matches_filter({"message": "INFO"}) is False
+        assert entry.matches_filter({"message": "info"}) is False
 
         # Test searching
-        assert entry.matches_search("ERROR") is True
+        assert entry.matches_search("error") is True
         assert entry.matches_search("12345") is True
         assert entry.matches_search("failed") is True
         assert entry.matches_search("nonexistent") is False
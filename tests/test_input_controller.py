@@ -0,0 +1,73 @@
+"""Tests for the FileInputController class"""
+
+import mmap
+import pathlib
+from typing import BinaryIO, Iterator
+from unittest.mock import Mock
+
+import pytest
+
+from juffi.input_controller import FileInputController
+
+
+@pytest.fixture(name="log_file")
+def log_file_fixture(tmp_path: pathlib.Path) -> Iterator[BinaryIO]:
+    """Create a log file with two complete lines and a partial one"""
+    path = tmp_path / "test.log"
+    path.write_bytes(b"first\nsecond\nthi")
+    with open(path, "rb") as file:
+        yield file
+
+
+def _append(file: BinaryIO, data: bytes) -> None:
+    with open(file.name, "ab") as writer:
+        writer.write(data)
+
+
+def test_get_data_waits_for_the_rest_of_a_partial_line(log_file: BinaryIO) -> None:
+    """Test that complete lines are read and a partial line once it is finished"""
+    # Arrange
+    controller = FileInputController(Mock(), log_file)
+    first_lines = list(controller.get_data())
+    _append(log_file, b"rd\n")
+
+    # Act
+    new_lines = list(controller.get_data())
+
+    # Assert
+    assert first_lines == ["first", "second"]
+    assert new_lines == ["third"]
+
+
+def test_get_data_reads_without_mapping_when_mapping_fails(
+    log_file: BinaryIO, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the file is read directly when it cannot be memory-mapped"""
+    # Arrange
+    monkeypatch.setattr(mmap, "mmap", Mock(side_effect=ValueError))
+    controller = FileInputController(Mock(), log_file)
+    first_lines = list(controller.get_data())
+    _append(log_file, b"rd\n")
+
+    # Act
+    new_lines = list(controller.get_data())
+
+    # Assert
+    assert first_lines == ["first", "second"]
+    assert new_lines == ["third"]
+
+
+def test_get_data_after_truncation_returns_nothing(log_file: BinaryIO) -> None:
+    """Test that a file truncated while it is followed yields no lines"""
+    # Arrange
+    controller = FileInputController(Mock(), log_file)
+    lines = controller.get_data()
+    next(lines)
+    with open(log_file.name, "wb"):
+        pass
+
+    # Act
+    remaining_lines = list(lines) + list(controller.get_data())
+
+    # Assert
+    assert remaining_lines == ["second"]
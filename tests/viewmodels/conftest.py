@@ -0,0 +1,27 @@
+"""Shared fixtures for viewmodel tests"""
+
+import pytest
+
+from juffi.models.juffi_model import JuffiState
+from juffi.viewmodels.app import AppModel
+from tests.infra.mock_input_controller import MockInputController
+
+
+@pytest.fixture(name="state")
+def state_fixture() -> JuffiState:
+    """Create a fresh JuffiState instance for testing."""
+    return JuffiState()
+
+
+@pytest.fixture(name="input_controller")
+def input_controller_fixture() -> MockInputController:
+    """Create an empty MockInputController for testing."""
+    return MockInputController()
+
+
+@pytest.fixture(name="app_model")
+def app_model_fixture(
+    state: JuffiState, input_controller: MockInputController
+) -> AppModel:
+    """Create an AppModel instance with standard setup."""
+    return AppModel(state, input_controller, lambda: None)
@@ -1,13 +1,11 @@
 """Tests for the AppModel viewmodel class."""
 
-from typing import Iterator
-
 import pytest
 
 from juffi.helpers.curses_utils import Size
-from juffi.input_controller import InputController
 from juffi.models.juffi_model import JuffiState, ViewMode
 from juffi.viewmodels.app import AppModel
+from tests.infra.mock_input_controller import MockInputController
 
 TEXT_LINES = [
     "2023-01-01 10:00:00 INFO Application started",
@@ -28,80 +26,10 @@ MULTIPLE_CALLS_LINES = [
 ]
 
 
-class MockInputController(InputController):
-    """Mock input controller for testing"""
-
-    def __init__(
-        self, data_lines: list[str] | None = None, input_name: str = "test.log"
-    ):
-        self.data_lines = data_lines or []
-        self.input_keys: list[int] = []
-        self.input_index: int = 0
-        self.input_name = input_name
-        self.last_read_index: int = 0
-
-    @property
-    def name(self) -> str:
-        return self.input_name
-
-    def get_input(self) -> int:
-        if self.input_index < len(self.input_keys):
-            key = self.input_keys[self.input_index]
-            self.input_index += 1
-            return key
-        return -1
-
-    def get_data(self) -> Iterator[str]:
-        new_lines = self.data_lines[self.last_read_index :]
-        self.last_read_index = len(self.data_lines)
-        return iter(new_lines)
-
-    def add_data(self, new_lines: list[str]) -> None:
-        """Add new data to the same data list"""
-        self.data_lines.extend(new_lines)
-
-    def reset(self) -> None:
-        """Reset the read index to the beginning"""
-        self.last_read_index = 0
-
-    def timeout(self, delay: int) -> None:
-        """Set blocking or non-blocking read"""
-
-
-def create_mock_controller_from_string(
-    data: str, input_name: str = "test.log"
-) -> MockInputController:
-    """Helper function to create MockInputController from string data"""
-    lines = data.split("\n") if data else []
-    lines = [line for line in lines if line.strip()]
-    return MockInputController(lines, input_name)
-
-
 def dummy_callback() -> None:
     """Dummy callback function for testing."""
 
 
-@pytest.fixture(name="state")
-def state_fixture() -> JuffiState:
-    """Create a fresh JuffiState instance for testing."""
-    return JuffiState()
-
-
-@pytest.fixture(name="input_controller")
-def input_controller_fixture() -> MockInputController:
-    """Create an empty MockInputController for testing."""
-    return create_mock_controller_from_string("")
-
-
-@pytest.fixture(name="app_model")
-def app_model_fixture(
-    state: JuffiState,
-    input_controller: MockInputController,
-) -> AppModel:
-    """Create an AppModel instance with standard setup."""
-    return AppModel(state, input_controller, dummy_callback)
-
-
 @pytest.fixture(name="app_model_with_json")
 def app_model_with_json_fixture(
     state: JuffiState,
@@ -532,6 +460,113 @@ def test_apply_filters_with_search_term(
     assert "user" in filtered[1].get_value("message").lower()
 
 
+def test_apply_filters_ignores_case_of_filters_and_search_term(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that filters and search term match regardless of their case."""
+    # Arrange
+    input_controller.add_data(
+        [
+            '{"level": "error", "message": "Database connection failed"}',
+            '{"level": "info", "message": "Database ready"}',
+        ]
+    )
+    app_model.load_entries()
+    state.update_filters({"level": "ERROR"})
+    state.search_term = "DATABASE"
+
+    # Act
+    app_model.apply_filters()
+
+    # Assert
+    assert [entry.line_number for entry in state.filtered_entries] == [1]
+
+
+def test_apply_filters_narrowing_then_widening_search(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that extending and then shortening the search term matches correctly."""
+    # Arrange
+    json_lines = [
+        '{"level": "info", "message": "User login successful"}',
+        '{"level": "error", "message": "User logout failed"}',
+        '{"level": "info", "message": "Database ready"}',
+    ]
+    input_controller.add_data(json_lines)
+    app_model.load_entries()
+
+    # Act
+    state.search_term = "user"
+    app_model.apply_filters()
+    state.search_term = "user log"
+    app_model.apply_filters()
+    narrowed = len(state.filtered_entries)
+    state.search_term = "user login"
+    app_model.apply_filters()
+    narrowest = len(state.filtered_entries)
+    state.search_term = "d"
+    app_model.apply_filters()
+
+    # Assert
+    assert narrowed == 2
+    assert narrowest == 1
+    assert len(state.filtered_entries) == 2
+
+
+def test_apply_filters_narrowing_includes_new_entries(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that entries loaded after the last filtering are still matched."""
+    # Arrange
+    input_controller.add_data(['{"level": "error", "message": "first failure"}'])
+    app_model.load_entries()
+    state.update_filters({"level": "err"})
+    app_model.apply_filters()
+    input_controller.add_data(
+        [
+            '{"level": "error", "message": "second failure"}',
+            '{"level": "info", "message": "all good"}',
+        ]
+    )
+    app_model.load_entries()
+
+    # Act
+    state.update_filters({"level": "error"})
+    app_model.apply_filters()
+
+    # Assert
+    messages = {entry.get_value("message") for entry in state.filtered_entries}
+    assert messages == {"first failure", "second failure"}
+
+
+def test_apply_filters_new_search_under_same_filters(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that replacing the search keeps the filters and sees new entries."""
+    # Arrange
+    input_controller.add_data(
+        [
+            '{"level": "error", "message": "disk full"}',
+            '{"level": "info", "message": "disk ok"}',
+        ]
+    )
+    app_model.load_entries()
+    state.update_filters({"level": "err"})
+    app_model.apply_filters()
+    state.search_term = "full"
+    app_model.apply_filters()
+    input_controller.add_data(['{"level": "error", "message": "disk slow"}'])
+    app_model.load_entries()
+
+    # Act
+    state.search_term = "disk"
+    app_model.apply_filters()
+
+    # Assert
+    messages = {entry.get_value("message") for entry in state.filtered_entries}
+    assert messages == {"disk full", "disk slow"}
+
+
 def test_apply_filters_combined(
     app_model: AppModel, state: JuffiState, input_controller: MockInputController
 ) -> None:
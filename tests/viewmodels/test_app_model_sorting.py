@@ -0,0 +1,73 @@
+"""Tests for how AppModel keeps filtered entries sorted as they change."""
+
+from juffi.models.juffi_model import JuffiState
+from juffi.viewmodels.app import AppModel
+from tests.infra.mock_input_controller import MockInputController
+
+
+def test_sorting_follows_new_entries_and_type_changes(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that sorting stays correct as entries arrive and change a column type"""
+    # Arrange
+    input_controller.add_data(['{"count": 10}', '{"count": 2}'])
+    app_model.load_entries()
+    state.sort_column = "count"
+    state.sort_reverse = False
+    app_model.apply_filters()
+
+    # Act
+    input_controller.add_data(['{"count": 5}'])
+    app_model.update_entries()
+    numeric_order = [entry.get_value("count") for entry in state.filtered_entries]
+    input_controller.add_data(['{"count": "abc"}'])
+    app_model.update_entries()
+
+    # Assert
+    assert numeric_order == ["2", "5", "10"]
+    string_order = [entry.get_value("count") for entry in state.filtered_entries]
+    assert string_order == ["10", "2", "5", "abc"]
+
+
+def test_reverse_sorting_places_new_ties_after_earlier_entries(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that new entries merge into a reverse sort in the same order as a full sort"""
+    # Arrange
+    input_controller.add_data(['{"n": 1}', '{"n": 3}'])
+    app_model.load_entries()
+    state.sort_column = "n"
+    state.sort_reverse = True
+    app_model.apply_filters()
+    input_controller.add_data(['{"n": 3}', '{"n": 2}', '{"n": 1}'])
+
+    # Act
+    app_model.update_entries()
+
+    # Assert
+    line_numbers = [entry.line_number for entry in state.filtered_entries]
+    assert line_numbers == [2, 3, 4, 1, 5]
+
+
+def test_narrowing_search_keeps_sorted_order(
+    app_model: AppModel, state: JuffiState, input_controller: MockInputController
+) -> None:
+    """Test that narrowing the search keeps the remaining entries sorted"""
+    # Arrange
+    input_controller.add_data(
+        ['{"n": 3, "m": "ab"}', '{"n": 1, "m": "abc"}', '{"n": 2, "m": "a"}']
+    )
+    app_model.load_entries()
+    state.sort_column = "n"
+    state.sort_reverse = False
+    state.search_term = "a"
+    app_model.apply_filters()
+    input_controller.add_data(['{"n": 0, "m": "abd"}'])
+    app_model.load_entries()
+
+    # Act
+    state.search_term = "ab"
+    app_model.apply_filters()
+
+    # Assert
+    assert [entry.get_value("n") for entry in state.filtered_entries] == ["0", "1", "3"]
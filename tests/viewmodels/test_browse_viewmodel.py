@@ -322,3 +322,25 @@ def test_handle_input_character(state, viewmodel):
 
     assert state.input_buffer == "hello"
     assert state.input_cursor_pos == 3
+
+
+def test_handle_input_character_at_end(state, viewmodel):
+    """Test input character appended at the end of the buffer"""
+    state.input_buffer = "hell"
+    state.input_cursor_pos = 4
+
+    viewmodel.handle_input_character("o")
+
+    assert state.input_buffer == "hello"
+    assert state.input_cursor_pos == 5
+
+
+def test_handle_input_delete_at_end(state, viewmodel):
+    """Test input delete at end of buffer"""
+    state.input_buffer = "hello"
+    state.input_cursor_pos = 5
+
+    viewmodel.handle_input_delete()
+
+    assert state.input_buffer == "hello"
+    assert state.input_cursor_pos == 5
@@ -0,0 +1,79 @@
+"""Tests for the ColumnManagementViewModel class"""
+
+import pytest
+
+from juffi.helpers.indexed_dict import IndexedDict
+from juffi.models.column import Column
+from juffi.viewmodels.column_management import ColumnManagementViewModel
+
+
+@pytest.fixture(name="viewmodel")
+def viewmodel_fixture() -> ColumnManagementViewModel:
+    """Create a ColumnManagementViewModel with two selected and two available columns"""
+    viewmodel = ColumnManagementViewModel()
+    columns = IndexedDict[Column](
+        [("time", Column("time")), ("level", Column("level"))]
+    )
+    viewmodel.initialize_from_columns(columns, {"message", "host"})
+    return viewmodel
+
+
+def test_move_column_to_available_keeps_available_sorted(
+    viewmodel: ColumnManagementViewModel,
+) -> None:
+    """Test that a column moved to the available pane is inserted in sorted order"""
+    # Arrange
+    viewmodel.move_focus("right")
+    viewmodel.move_selection(1)
+    viewmodel.handle_enter()
+
+    # Act
+    viewmodel.move_focus("left")
+
+    # Assert
+    assert viewmodel.get_available_columns() == [
+        ("host", False),
+        ("level", True),
+        ("message", False),
+    ]
+    assert viewmodel.selected_columns == ["time"]
+    assert viewmodel.is_pane_focused("available")
+
+
+def test_move_selected_column_reorders_its_pane(
+    viewmodel: ColumnManagementViewModel,
+) -> None:
+    """Test that moving a chosen column up or down reorders the pane it is in"""
+    # Arrange
+    viewmodel.move_focus("right")
+    viewmodel.move_selection(1)
+    viewmodel.handle_enter()
+
+    # Act
+    viewmodel.move_selection(-1)
+
+    # Assert
+    assert viewmodel.get_selected_columns() == [("level", True), ("time", False)]
+    assert [name for name, _ in viewmodel.get_available_columns()] == [
+        "host",
+        "message",
+    ]
+
+
+def test_move_selected_column_by_several_positions() -> None:
+    """Test that moving a chosen column further than one step shifts the rest"""
+    # Arrange
+    viewmodel = ColumnManagementViewModel()
+    viewmodel.initialize_from_columns(IndexedDict[Column](), {"a", "b", "c", "d"})
+    viewmodel.handle_enter()
+
+    # Act
+    viewmodel.move_selection(2)
+
+    # Assert
+    assert viewmodel.get_available_columns() == [
+        ("b", False),
+        ("c", False),
+        ("a", True),
+        ("d", False),
+    ]
@@ -206,6 +206,22 @@ def test_get_entry_fields_plain_text_entry(viewmodel):
     assert fields == expected_fields
 
 
+def test_get_entry_fields_reused_until_entry_changes(viewmodel):
+    """Test that fields are reused for the same entry and rebuilt for another"""
+    # Arrange
+    first = LogEntry(json.dumps({"message": "first"}), 1)
+    second = LogEntry(json.dumps({"message": "second"}), 2)
+    first_fields = viewmodel.get_entry_fields(first)
+
+    # Act
+    same_fields = viewmodel.get_entry_fields(first)
+    second_fields = viewmodel.get_entry_fields(second)
+
+    # Assert
+    assert same_fields is first_fields
+    assert second_fields == [("message", "second")]
+
+
 def test_enter_mode_no_entries(state):
     """Test entering mode when no entries exist"""
     # Arrange
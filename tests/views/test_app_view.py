@@ -0,0 +1,35 @@
+"""Tests for the App view"""
+
+import pytest
+
+from juffi.helpers.curses_utils import Size
+from juffi.views.app import App, AppExit
+from tests.infra.mock_input_controller import MockInputController
+from tests.infra.mock_output_controller import MockOutputController
+
+
+def test_reset_before_first_poll_selects_last_reloaded_entry() -> None:
+    """Test that a reset before the first poll selects the edge row of the reloaded entries"""
+    # Arrange
+    input_controller = MockInputController(
+        [
+            "2024-01-01 10:00:00 INFO Application started",
+            "2024-01-01 10:00:01 DEBUG Processing request",
+            "2024-01-01 10:00:02 INFO Request processed",
+        ]
+    )
+    input_controller.input_keys = [ord("R"), ord("q")]
+    output_controller = MockOutputController(Size(24, 80))
+    app = App(
+        output_controller.create_main_window(),
+        no_follow=False,
+        input_controller=input_controller,
+        output_controller=output_controller,
+    )
+
+    # Act
+    with pytest.raises(AppExit):
+        app.run()
+
+    # Assert
+    assert "Row 3/3" in output_controller.get_screen()
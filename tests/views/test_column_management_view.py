@@ -127,3 +127,20 @@ def test_column_management_displays_selected_columns(
     assert "timestamp" in screen
     assert "level" in screen
     assert "message" in screen
+
+
+def test_column_management_inserts_discovered_columns_sorted(
+    state: JuffiState, mock_window: Window, output_controller: MockOutputController
+):
+    """Test that columns discovered while open are inserted in sorted order"""
+    state.columns = IndexedDict({"timestamp": Column("timestamp")})
+    state.all_discovered_columns = {"timestamp", "message"}
+    view = ColumnManagementMode(state, mock_window)
+    view.enter_mode()
+
+    state.all_discovered_columns.add("zeta")
+    state.all_discovered_columns.add("alpha")
+    view.draw()
+
+    screen = output_controller.get_screen()
+    assert screen.index("alpha") < screen.index("message") < screen.index("zeta")
@@ -4,7 +4,7 @@ import curses
 
 import pytest
 
-from juffi.helpers.curses_utils import Size
+from juffi.helpers.curses_utils import Position, Size
 from juffi.models.juffi_model import JuffiState
 from juffi.models.log_entry import LogEntry
 from juffi.views.details import DetailsMode
@@ -85,6 +85,32 @@ def test_details_mode_draws_entry_fields(
     assert "First entry" in line_4
 
 
+def test_details_mode_truncates_unselected_field_values(
+    details_mode: DetailsMode,
+    state: JuffiState,
+    output_controller: MockOutputController,
+) -> None:
+    """Test that unselected values are cut to one line and blank ones are kept"""
+    # Arrange
+    long_value = " ".join(["word"] * 30)
+    entries = [
+        LogEntry(
+            raw_line=f'{{"a": "x", "b": "   ", "c": "{long_value}"}}', line_number=1
+        )
+    ]
+    state.filtered_entries = entries
+    state.current_row = 0
+
+    # Act
+    details_mode.draw(entries)
+
+    # Assert
+    assert "b:" in output_controller.get_screen_line(4)
+    line_5 = output_controller.get_screen_line(5)
+    assert "c:" in line_5
+    assert "[...]" in line_5
+
+
 def test_details_mode_does_not_draw_when_no_entries(
     details_mode: DetailsMode,
     output_controller: MockOutputController,
@@ -166,6 +192,71 @@ def test_details_mode_navigate_to_previous_entry(
     assert "First entry" in screen
 
 
+def test_details_mode_skips_redraw_when_unchanged(
+    details_mode: DetailsMode,
+    state: JuffiState,
+    sample_entries: list[LogEntry],
+    output_controller: MockOutputController,
+) -> None:
+    """Test that details mode does not repaint an unchanged view"""
+    # Arrange
+    state.filtered_entries = sample_entries
+    state.current_row = 0
+    details_mode.enter_mode()
+    details_mode.draw(sample_entries)
+    output_controller.create_main_window().addstr(Position(0, 1), "untouched")
+
+    # Act
+    details_mode.draw(sample_entries)
+
+    # Assert
+    assert "untouched" in output_controller.get_screen_line(0)
+
+
+def test_details_mode_redraws_after_navigating_fields(
+    details_mode: DetailsMode,
+    state: JuffiState,
+    sample_entries: list[LogEntry],
+    output_controller: MockOutputController,
+) -> None:
+    """Test that details mode repaints when the current field changes"""
+    # Arrange
+    state.filtered_entries = sample_entries
+    state.current_row = 0
+    details_mode.enter_mode()
+    details_mode.draw(sample_entries)
+
+    # Act
+    details_mode.handle_input(curses.KEY_DOWN)
+    details_mode.draw(sample_entries)
+
+    # Assert
+    assert "► message:" in output_controller.get_screen_line(4)
+
+
+def test_details_mode_blanks_lines_left_by_previous_selection(
+    details_mode: DetailsMode,
+    state: JuffiState,
+    output_controller: MockOutputController,
+) -> None:
+    """Test that a collapsed multi-line value leaves no stale lines behind"""
+    # Arrange
+    entries = [LogEntry(raw_line='{"a": "one\\ntwo\\nthree", "b": "x"}', line_number=1)]
+    state.filtered_entries = entries
+    state.current_row = 0
+    details_mode.enter_mode()
+    details_mode.draw(entries)
+    assert "three" in output_controller.get_screen_line(5)
+
+    # Act
+    details_mode.handle_input(curses.KEY_DOWN)
+    details_mode.draw(entries)
+
+    # Assert
+    assert "► b:" in output_controller.get_screen_line(4)
+    assert output_controller.get_screen_line(5).strip() == ""
+
+
 def test_details_mode_shows_field_count(
     details_mode: DetailsMode,
     state: JuffiState,
@@ -164,6 +164,29 @@ def test_draw_after_scroll_down(
     assert not has_selected_color_at_line(output_controller, 8)
 
 
+def test_draw_selection_move_without_other_changes(
+    entries_window: EntriesWindow,
+    state: JuffiState,
+    sample_entries: list[LogEntry],
+    output_controller: MockOutputController,
+) -> None:
+    """Test that moving only the selection repaints the old and new rows"""
+    state.set_filtered_entries(sample_entries)
+    state.current_row = 0
+    entries_window.set_data()
+    entries_window.draw()
+    full_screen = output_controller.get_screen()
+    state.clear_changes()
+
+    entries_window.handle_navigation(curses.KEY_DOWN)
+    entries_window.draw()
+
+    assert state.current_row == 1
+    assert not has_selected_color_at_line(output_controller, 2)
+    assert has_selected_color_at_line(output_controller, 3)
+    assert output_controller.get_screen() == full_screen
+
+
 def test_draw_after_scroll_up(
     entries_window: EntriesWindow,
     state: JuffiState,
@@ -285,3 +308,26 @@ def test_get_current_column(
         state.current_column = columns[1]
         current_col = entries_window.get_current_column()
         assert current_col == columns[1]
+
+
+def test_draw_colors_rows_by_level_in_any_case(
+    entries_window: EntriesWindow,
+    state: JuffiState,
+    output_controller: MockOutputController,
+) -> None:
+    """Test that rows are colored by their level regardless of its casing"""
+    entries = [
+        LogEntry(raw_line='{"level": "selected", "message": "a"}', line_number=1),
+        LogEntry(raw_line='{"level": "Warn", "message": "b"}', line_number=2),
+        LogEntry(raw_line='{"level": "eRRor", "message": "c"}', line_number=3),
+    ]
+    state.set_filtered_entries(entries)
+    state.current_row = 0
+    entries_window.set_data()
+
+    entries_window.draw()
+
+    content = output_controller.get_screen_content()
+    line_colors = {pos.y: cell.color for pos, cell in content.items() if pos.x == 1}
+    assert line_colors[3] == Color.WARNING
+    assert line_colors[4] == Color.ERROR
@@ -1,8 +1,10 @@
 """Tests for the HelpMode view"""
 
+import curses
+
 import pytest
 
-from juffi.helpers.curses_utils import Size
+from juffi.helpers.curses_utils import Position, Size
 from juffi.models.juffi_model import JuffiState
 from juffi.output_controller import Window
 from juffi.views.help import HelpMode
@@ -184,3 +186,37 @@ def test_help_mode_draws_file_operations(
     screen = output_controller.get_screen()
     assert "File Operations:" in screen
     assert "Toggle follow mode" in screen
+
+
+def test_help_mode_skips_redraw_when_unchanged(
+    help_mode: HelpMode,
+    mock_window: Window,
+    state: JuffiState,
+    output_controller: MockOutputController,
+) -> None:
+    """Test that help mode does not redraw when nothing changed"""
+    state.terminal_size = Size(24, 80)
+    help_mode.draw(mock_window)
+    mock_window.addstr(Position(0, 0), "untouched")
+
+    help_mode.draw(mock_window)
+
+    line = output_controller.get_screen_line(0)
+    assert "untouched" in line
+
+
+def test_help_mode_redraws_after_scrolling(
+    help_mode: HelpMode,
+    mock_window: Window,
+    state: JuffiState,
+    output_controller: MockOutputController,
+) -> None:
+    """Test that help mode redraws the text after scrolling"""
+    state.terminal_size = Size(24, 80)
+    help_mode.draw(mock_window)
+
+    help_mode.handle_input(curses.KEY_DOWN)
+    help_mode.draw(mock_window)
+
+    line = output_controller.get_screen_line(0)
+    assert "JSON LOG VIEWER - HELP" not in line